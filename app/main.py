@@ -10,12 +10,6 @@ import asyncio
 import os
 from app.config import Config
 from app.utils.logging import get_logger
-from app.services.slack_handler import SlackHandler
-from app.services.database_service import DatabaseService
-from app.services.emoji_service import EmojiService
-from app.services.openai_service import OpenAIService
-from app.services.slash_command_handler import SlashCommandHandler
-from app.utils.permission_manager import PermissionManager
 
 logger = get_logger("main")
 
@@ -28,6 +22,15 @@ async def main():
     """Main application entry point."""
     global slack_handler, db_service
 
+    # Service modules pull in slack_bolt, openai, psycopg etc.; import them
+    # only when the bot actually starts.
+    from app.services.slack_handler import SlackHandler
+    from app.services.database_service import DatabaseService
+    from app.services.emoji_service import EmojiService
+    from app.services.openai_service import OpenAIService
+    from app.services.slash_command_handler import SlashCommandHandler
+    from app.utils.permission_manager import PermissionManager
+
     logger.info("Starting Slack Emoji Reaction Bot...")
 
     try:
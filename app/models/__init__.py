@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """Models module."""
 from app.models.emoji import EmojiData
+from app.models.emoji_table import EmojiTable
 from app.models.admin_user import AdminUser, Permission
 
-__all__ = ["EmojiData", "AdminUser", "Permission"]
+__all__ = ["EmojiData", "EmojiTable", "AdminUser", "Permission"]
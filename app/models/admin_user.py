@@ -4,10 +4,10 @@
 スラッシュコマンドの権限管理用のデータモデル
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, UTC
 from enum import Enum
-from typing import Optional
+from typing import Optional, Tuple
 
 
 class Permission(Enum):
@@ -21,26 +21,32 @@ class Permission(Enum):
         """権限レベルの比較"""
         if not isinstance(other, Permission):
             return NotImplemented
-        order = [Permission.VIEWER, Permission.EDITOR, Permission.ADMIN]
-        return order.index(self) < order.index(other)
+        return _PERMISSION_RANK[self] < _PERMISSION_RANK[other]
 
     def __le__(self, other):
         """権限レベルの比較"""
-        return self == other or self < other
+        if not isinstance(other, Permission):
+            return NotImplemented
+        return _PERMISSION_RANK[self] <= _PERMISSION_RANK[other]
 
     def __gt__(self, other):
         """権限レベルの比較"""
         if not isinstance(other, Permission):
             return NotImplemented
-        order = [Permission.VIEWER, Permission.EDITOR, Permission.ADMIN]
-        return order.index(self) > order.index(other)
+        return _PERMISSION_RANK[self] > _PERMISSION_RANK[other]
 
     def __ge__(self, other):
         """権限レベルの比較"""
-        return self == other or self > other
+        if not isinstance(other, Permission):
+            return NotImplemented
+        return _PERMISSION_RANK[self] >= _PERMISSION_RANK[other]
+
+
+# 権限レベルの序列（定義順: VIEWER < EDITOR < ADMIN）
+_PERMISSION_RANK = {permission: rank for rank, permission in enumerate(Permission)}
 
 
-@dataclass
+@dataclass(slots=True)
 class AdminUser:
     """管理者ユーザーモデル"""
 
@@ -49,6 +55,13 @@ class AdminUser:
     permission: Permission
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+    # to_dict用のisoformatキャッシュ（元のdatetimeが差し替えられたら再計算）
+    _iso_source: Tuple[Optional[datetime], Optional[datetime]] = field(
+        default=(None, None), init=False, repr=False, compare=False
+    )
+    _iso_cache: Tuple[Optional[str], Optional[str]] = field(
+        default=(None, None), init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """初期化後の処理"""
@@ -67,12 +80,21 @@ class AdminUser:
 
     def to_dict(self) -> dict:
         """辞書への変換"""
+        created_at, updated_at = self.created_at, self.updated_at
+        source = self._iso_source
+        if source[0] is not created_at or source[1] is not updated_at:
+            self._iso_source = (created_at, updated_at)
+            self._iso_cache = (
+                created_at.isoformat() if created_at else None,
+                updated_at.isoformat() if updated_at else None,
+            )
+        created_iso, updated_iso = self._iso_cache
         return {
             "user_id": self.user_id,
             "username": self.username,
             "permission": self.permission.value,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "created_at": created_iso,
+            "updated_at": updated_iso,
         }
 
     @classmethod
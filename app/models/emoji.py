@@ -9,14 +9,47 @@ PostgreSQL emojisテーブルに対応するデータモデル:
 - emotion_tone: VARCHAR(20) (positive/negative/neutral)
 - usage_scene: VARCHAR(100) (usage context)
 - priority: INTEGER DEFAULT 1 (weighting factor)
-- embedding: VECTOR(1536) (OpenAI embedding vector)
+- embedding: HALFVEC(1536) (OpenAI embedding vector, stored as FP16)
 - created_at: TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 - updated_at: TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 """
 
-import re
+import operator
+import sys
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+# バリデーション用定数（検証処理ではクラス属性ではなくこちらを直接参照する）
+_VALID_EMOTION_TONES = ("positive", "negative", "neutral")
+_MAX_CODE_LENGTH = 100
+_EMBEDDING_DIMENSION = 1536
+_EMBEDDING_SHAPE = (_EMBEDDING_DIMENSION,)
+_MIN_PRIORITY = 1
+_MAX_PRIORITY = 10
+
+# 感情トーンの正規インスタンス（_VALID_EMOTION_TONESの要素そのもの）
+_EMOTION_TONES: Dict[str, str] = {tone: tone for tone in _VALID_EMOTION_TONES}
+
+
+# カテゴリ（語彙の限られた列）の共有プール（同一値は同一オブジェクトを参照）。
+# usage_sceneは自由記述のためプールせず、値がプロセス終了まで残らないようにする
+_CATEGORY_POOL: Dict[str, str] = {}
+# 想定外に多くの値が来てもプールが際限なく大きくならないための上限
+_CATEGORY_POOL_MAX_SIZE = 1024
+
+
+def _pooled_category(value: Optional[str]) -> Optional[str]:
+    """カテゴリをプール内の共有インスタンスに置き換える"""
+    if value is None:
+        return None
+    pooled = _CATEGORY_POOL.get(value)
+    if pooled is not None:
+        return pooled
+    if len(_CATEGORY_POOL) < _CATEGORY_POOL_MAX_SIZE:
+        _CATEGORY_POOL[value] = value
+    return value
 
 
 class EmojiData:
@@ -25,14 +58,37 @@ class EmojiData:
 
     データベーステーブル 'emojis' に対応し、絵文字の
     メタデータと埋め込みベクトルを管理します。
+
+    埋め込みベクトルは連続したfloat32のndarrayとして保持します。
+    リストへの変換はシリアライズ時（to_dict）のみ行うため、
+    メモリ上で類似度計算などを行う場合はndarrayのまま扱ってください。
     """
 
+    # インスタンス辞書を持たせずメモリ使用量を抑える
+    # similarity_scoreは類似検索の結果にのみ設定される動的属性
+    __slots__ = (
+        "id",
+        "code",
+        "description",
+        "category",
+        "emotion_tone",
+        "usage_scene",
+        "priority",
+        "embedding",
+        "created_at",
+        "updated_at",
+        "similarity_score",
+        "_validated",
+    )
+    similarity_score: float
+    _validated: Optional[Tuple[Any, ...]]
+
     # クラス定数
-    VALID_EMOTION_TONES = {"positive", "negative", "neutral"}
-    MAX_CODE_LENGTH = 100
-    EMBEDDING_DIMENSION = 1536
-    MIN_PRIORITY = 1
-    MAX_PRIORITY = 10
+    VALID_EMOTION_TONES = _VALID_EMOTION_TONES
+    MAX_CODE_LENGTH = _MAX_CODE_LENGTH
+    EMBEDDING_DIMENSION = _EMBEDDING_DIMENSION
+    MIN_PRIORITY = _MIN_PRIORITY
+    MAX_PRIORITY = _MAX_PRIORITY
 
     def __init__(
         self,
@@ -43,7 +99,7 @@ class EmojiData:
         usage_scene: Optional[str] = None,
         priority: int = 1,
         id: Optional[int] = None,
-        embedding: Optional[List[float]] = None,
+        embedding: Optional[Union[List[float], np.ndarray]] = None,
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None,
     ):
@@ -58,22 +114,22 @@ class EmojiData:
             usage_scene: 使用シーン
             priority: 優先度（1-10）
             id: データベースID（任意）
-            embedding: 埋め込みベクトル（1536次元）
+            embedding: 埋め込みベクトル（1536次元、リストまたはndarray）
             created_at: 作成日時
             updated_at: 更新日時
 
         Raises:
             ValueError: バリデーションエラー時
         """
-        # 必須フィールドの検証と設定
-        self.code = self._validate_and_set_code(code)
-        self.description = self._validate_and_set_description(description)
-
-        # オプションフィールドの検証と設定
-        self.category = category
-        self.emotion_tone = self._validate_and_set_emotion_tone(emotion_tone)
+        # フィールドの検証と設定
+        (
+            self.code,
+            self.description,
+            self.emotion_tone,
+            self.priority,
+        ) = self._validate_fields(code, description, emotion_tone, priority)
+        self.category = _pooled_category(category)
         self.usage_scene = usage_scene
-        self.priority = self._validate_and_set_priority(priority)
 
         # システムフィールド
         self.id = id
@@ -81,84 +137,154 @@ class EmojiData:
         self.created_at = created_at
         self.updated_at = updated_at
 
-    def _validate_and_set_code(self, code: str) -> str:
-        """絵文字コードのバリデーションと設定"""
+        # 検証済みの値を記録（いずれかのフィールドが別の値に変わると再検証される）
+        self._validated = self._validated_fields()
+
+    def _validate_fields(
+        self,
+        code: str,
+        description: str,
+        emotion_tone: Optional[str],
+        priority: int,
+    ) -> Tuple[str, str, Optional[str], int]:
+        """
+        スカラーフィールドをまとめてバリデーションし、正規化した値を返す
+
+        フィールドごとのメソッド呼び出しを避けるため、1つの関数内で検証します。
+
+        Returns:
+            Tuple[str, str, Optional[str], int]:
+                (code, description, emotion_tone, priority)
+
+        Raises:
+            ValueError: バリデーションエラー時
+        """
+        # 絵文字コード
         if not code:
             raise ValueError("code is required")
-
         if not isinstance(code, str):
             raise ValueError("code must be a string")
-
-        # 絵文字コードの形式チェック（:で囲まれている）
-        if not re.match(r"^:[^:]+:$", code):
+        # 絵文字コードの形式チェック（:で囲まれ、内部に:を含まない）
+        if len(code) < 3 or code[0] != ":" or code[-1] != ":" or code.count(":", 1, -1):
             raise ValueError("Invalid emoji code format: must be like ':emoji_name:'")
-
         # 長さチェック（Slack制限）
-        if len(code) > self.MAX_CODE_LENGTH:
-            raise ValueError(f"code too long: {len(code)} > {self.MAX_CODE_LENGTH}")
-
-        return code
+        if len(code) > _MAX_CODE_LENGTH:
+            raise ValueError(f"code too long: {len(code)} > {_MAX_CODE_LENGTH}")
 
-    def _validate_and_set_description(self, description: str) -> str:
-        """説明文のバリデーションと設定"""
+        # 説明文
         if not description:
             raise ValueError("description is required")
-
         if not isinstance(description, str):
             raise ValueError("description must be a string")
-
-        return description.strip()
-
-    def _validate_and_set_emotion_tone(
-        self, emotion_tone: Optional[str]
-    ) -> Optional[str]:
-        """感情トーンのバリデーションと設定"""
-        if emotion_tone is None:
-            return None
-
-        if emotion_tone not in self.VALID_EMOTION_TONES:
-            raise ValueError(
-                f"Invalid emotion_tone: {emotion_tone}. "
-                f"Must be one of {list(self.VALID_EMOTION_TONES)}"
-            )
-
-        return emotion_tone
-
-    def _validate_and_set_priority(self, priority: int) -> int:
-        """優先度のバリデーションと設定"""
-        if not isinstance(priority, int):
+        # 前後に空白がない場合（DB由来の値など通常のケース）はstripを省略
+        if description[0].isspace() or description[-1].isspace():
+            description = description.strip()
+
+        # 感情トーン（辞書引きで検証と定数側の文字列インスタンスの共有を兼ねる）
+        if emotion_tone is not None:
+            canonical_tone = _EMOTION_TONES.get(emotion_tone)
+            if canonical_tone is None:
+                raise ValueError(
+                    f"Invalid emotion_tone: {emotion_tone}. "
+                    f"Must be one of {_VALID_EMOTION_TONES}"
+                )
+            emotion_tone = canonical_tone
+
+        # 優先度
+        # numpy.int64など__index__を持つ整数型も受け付け、intに正規化する
+        try:
+            priority = operator.index(priority)
+        except TypeError:
             raise ValueError("Invalid priority: must be an integer")
-
-        if priority < self.MIN_PRIORITY or priority > self.MAX_PRIORITY:
+        if priority < _MIN_PRIORITY or priority > _MAX_PRIORITY:
             raise ValueError(
                 f"Invalid priority: {priority}. "
-                f"Must be between {self.MIN_PRIORITY} and {self.MAX_PRIORITY}"
+                f"Must be between {_MIN_PRIORITY} and {_MAX_PRIORITY}"
             )
 
-        return priority
+        return sys.intern(code), description, emotion_tone, priority
 
     def _validate_and_set_embedding(
-        self, embedding: Optional[List[float]]
-    ) -> Optional[List[float]]:
-        """埋め込みベクトルのバリデーションと設定"""
+        self, embedding: Optional[Union[List[float], np.ndarray]]
+    ) -> Optional[np.ndarray]:
+        """埋め込みベクトルのバリデーションと設定（float32のndarrayに変換）"""
         if embedding is None:
             return None
 
-        if not isinstance(embedding, list):
+        if not isinstance(embedding, (list, np.ndarray)):
             raise ValueError("embedding must be a list")
 
-        if len(embedding) != self.EMBEDDING_DIMENSION:
+        if len(embedding) != _EMBEDDING_DIMENSION:
             raise ValueError(
                 f"Invalid embedding dimension: {len(embedding)}. "
-                f"Must be {self.EMBEDDING_DIMENSION}"
+                f"Must be {_EMBEDDING_DIMENSION}"
             )
 
-        # すべての要素が数値であることを確認
+        # すべての要素が数値であることを確認（変換はNumPyのCループで一括実行）
+        try:
+            array = np.ascontiguousarray(embedding, dtype=np.float32)
+        except (ValueError, TypeError):
+            raise ValueError("embedding must contain only numeric values")
+
+        if array.shape != _EMBEDDING_SHAPE:
+            raise ValueError(
+                f"Invalid embedding dimension: {array.shape}. "
+                f"Must be {_EMBEDDING_DIMENSION}"
+            )
+
+        if not np.isfinite(array).all():
+            raise ValueError("embedding must contain only finite values")
+
+        return array
+
+    @classmethod
+    def validate_embeddings_batch(
+        cls, embeddings: Sequence[Union[List[float], np.ndarray]]
+    ) -> np.ndarray:
+        """
+        複数の埋め込みベクトルを一括で検証
+
+        一括取り込み時に行ごとの変換を避けるため、全ベクトルを1つの
+        (N, 1536) のfloat32配列にまとめ、次元数と有限値であることを
+        まとめて検証します。
+
+        Args:
+            embeddings: 埋め込みベクトルのシーケンス
+
+        Returns:
+            np.ndarray: 検証済みの (N, 1536) float32配列
+
+        Raises:
+            ValueError: バリデーションエラー時
+        """
+        for embedding in embeddings:
+            if not isinstance(embedding, (list, np.ndarray)):
+                raise ValueError("embedding must be a list")
+            if len(embedding) != _EMBEDDING_DIMENSION:
+                raise ValueError(
+                    f"Invalid embedding dimension: {len(embedding)}. "
+                    f"Must be {_EMBEDDING_DIMENSION}"
+                )
+
+        if not embeddings:
+            return np.empty((0, _EMBEDDING_DIMENSION), dtype=np.float32)
+
         try:
-            return [float(x) for x in embedding]
+            array = np.array(embeddings, dtype=np.float32)
         except (ValueError, TypeError):
             raise ValueError("embedding must contain only numeric values")
 
+        if array.ndim != 2:
+            raise ValueError(
+                f"Invalid embedding dimension: {array.shape[1:]}. "
+                f"Must be {_EMBEDDING_DIMENSION}"
+            )
+
+        if not np.isfinite(array).all():
+            raise ValueError("embedding must contain only finite values")
+
+        return array
+
     def to_dict(self) -> Dict[str, Any]:
         """
         インスタンスを辞書形式に変換
@@ -174,7 +300,9 @@ class EmojiData:
             "emotion_tone": self.emotion_tone,
             "usage_scene": self.usage_scene,
             "priority": self.priority,
-            "embedding": self.embedding,
+            "embedding": (
+                self.embedding.tolist() if self.embedding is not None else None
+            ),
             "created_at": self.created_at,
             "updated_at": self.updated_at,
         }
@@ -185,7 +313,7 @@ class EmojiData:
         辞書からEmojiDataインスタンスを作成
 
         Args:
-            data: 辞書形式のデータ
+            data: 辞書形式のデータ（embeddingはリストまたはndarray）
 
         Returns:
             EmojiData: 作成されたインスタンス
@@ -203,26 +331,85 @@ class EmojiData:
             updated_at=data.get("updated_at"),
         )
 
+    @classmethod
+    def from_record(cls, row: Sequence[Any]) -> "EmojiData":
+        """
+        信頼済みの1行分のデータからEmojiDataインスタンスを作成
+
+        データベースから読み出した行など、既に検証済みのデータ向けに
+        __init__のバリデーションを省略して属性を直接設定します。
+        外部からの入力には検証を行うfrom_dictを使用してください。
+
+        Args:
+            row: (id, code, description, category, emotion_tone, usage_scene,
+                 priority, embedding, created_at, updated_at) の順の行データ
+
+        Returns:
+            EmojiData: 作成されたインスタンス
+        """
+        emoji = cls.__new__(cls)
+        (
+            emoji.id,
+            code,
+            emoji.description,
+            category,
+            emotion_tone,
+            emoji.usage_scene,
+            emoji.priority,
+            embedding,
+            emoji.created_at,
+            emoji.updated_at,
+        ) = row
+        emoji.code = sys.intern(code)
+        emoji.category = _pooled_category(category)
+        emoji.emotion_tone = _EMOTION_TONES.get(emotion_tone, emotion_tone)
+        emoji.embedding = (
+            np.asarray(embedding, dtype=np.float32) if embedding is not None else None
+        )
+        emoji._validated = None
+        return emoji
+
     def is_valid(self) -> bool:
         """
         データの妥当性をチェック
 
+        検証済みの値から変更されていない場合は再検証を省略します。
+        変更の判定は各フィールドの同一性（is）で行うため、属性代入ごとの
+        処理は不要です（ndarrayの要素を直接書き換えた場合は検知しません）。
+
         Returns:
             bool: 妥当な場合True
         """
+        fields = self._validated_fields()
+        validated = self._validated
+        if validated is not None and all(map(operator.is_, fields, validated)):
+            return True
+        if not self._check_valid():
+            return False
+        self._validated = fields
+        return True
+
+    def _validated_fields(self) -> Tuple[Any, ...]:
+        """バリデーション対象フィールドの現在の値"""
+        return (
+            self.code,
+            self.description,
+            self.emotion_tone,
+            self.priority,
+            self.embedding,
+        )
+
+    def _check_valid(self) -> bool:
+        """全フィールドを再検証"""
         try:
             # 必須フィールドのチェック
             if not self.code or not self.description:
                 return False
 
             # 各フィールドの妥当性をチェック
-            self._validate_and_set_code(self.code)
-            self._validate_and_set_description(self.description)
-
-            if self.emotion_tone is not None:
-                self._validate_and_set_emotion_tone(self.emotion_tone)
-
-            self._validate_and_set_priority(self.priority)
+            self._validate_fields(
+                self.code, self.description, self.emotion_tone, self.priority
+            )
 
             if self.embedding is not None:
                 self._validate_and_set_embedding(self.embedding)
@@ -237,26 +424,31 @@ class EmojiData:
         return f"EmojiData({self.code}: {self.description})"
 
     def __repr__(self) -> str:
-        """詳細な文字列表現"""
+        """詳細な文字列表現（説明文は30文字で切り詰め）"""
+        ellipsis = "..." if len(self.description) > 30 else ""
         return (
             f"EmojiData(id={self.id}, code='{self.code}', "
-            f"description='{self.description[:30]}...', "
+            f"description='{self.description:.30}{ellipsis}', "
             f"category='{self.category}', emotion_tone='{self.emotion_tone}', "
             f"priority={self.priority})"
         )
 
     def __eq__(self, other) -> bool:
-        """等価性比較"""
+        """等価性比較（識別性の高いフィールドから順に比較して早期に打ち切る）"""
+        if self is other:
+            return True
+
         if not isinstance(other, EmojiData):
             return False
 
+        # codeは共有インスタンスのため、一致する場合は多くが同一オブジェクト比較で済む
         return (
             self.code == other.code
-            and self.description == other.description
-            and self.category == other.category
+            and self.priority == other.priority
             and self.emotion_tone == other.emotion_tone
+            and self.category == other.category
             and self.usage_scene == other.usage_scene
-            and self.priority == other.priority
+            and self.description == other.description
         )
 
     def __hash__(self) -> int:
@@ -0,0 +1,172 @@
+"""
+EmojiTable - 絵文字データの列指向（SoA）表現
+
+EmojiDataのリストから埋め込みベクトルを (N, 1536) の連続したfloat32行列に
+まとめ、クエリベクトルとの類似度を1回の行列積で計算するためのモデル
+"""
+
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from app.models.emoji import EmojiData
+
+# 量子化した行列の類似度計算で1度にfloat32へ変換する行数（256行 × 1536次元で1.5MB）
+_SIMILARITY_BLOCK_ROWS = 256
+
+
+@dataclass(slots=True)
+class EmojiTable:
+    """
+    埋め込みを持つ絵文字を列ごとの配列で保持するテーブル
+
+    embeddingsの各行はL2正規化済みのため、正規化したクエリとの内積が
+    そのままコサイン類似度になります。
+
+    quantize=Trueで作成した場合、embeddingsは行ごとのスケールで量子化した
+    int8で保持され（float32の1/4のメモリ）、類似度は近似値になります。
+    """
+
+    emojis: List[EmojiData]
+    ids: np.ndarray  # (N,) int64、IDがない場合は-1
+    codes: List[str]
+    embeddings: np.ndarray  # (N, 1536) 行ごとにL2正規化済み（float32またはint8）
+    scales: Optional[np.ndarray] = None  # (N,) float32、int8量子化時の行ごとのスケール
+
+    @classmethod
+    def from_emojis(
+        cls, emojis: Iterable[EmojiData], quantize: bool = False
+    ) -> "EmojiTable":
+        """
+        EmojiDataから埋め込みを持つものだけを集めてテーブルを作成
+
+        Args:
+            emojis: 絵文字データ
+            quantize: Trueの場合は埋め込みをint8に量子化して保持する
+
+        Returns:
+            EmojiTable: 作成されたテーブル
+        """
+        rows = []
+        vectors = []
+        for emoji in emojis:
+            if emoji.embedding is not None:
+                rows.append(emoji)
+                vectors.append(emoji.embedding)
+
+        if vectors:
+            embeddings = np.stack(vectors)
+        else:
+            embeddings = np.empty((0, EmojiData.EMBEDDING_DIMENSION), dtype=np.float32)
+
+        # ゼロベクトルの行は0除算を避けるためノルムを1として扱う
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        embeddings /= norms
+
+        scales = None
+        if quantize:
+            embeddings, scales = _quantize_rows(embeddings)
+
+        return cls(
+            emojis=rows,
+            ids=np.array(
+                [emoji.id if emoji.id is not None else -1 for emoji in rows],
+                dtype=np.int64,
+            ),
+            codes=[emoji.code for emoji in rows],
+            embeddings=embeddings,
+            scales=scales,
+        )
+
+    def __len__(self) -> int:
+        """テーブルの行数"""
+        return len(self.emojis)
+
+    def similarities(self, query_vector: Union[List[float], np.ndarray]) -> np.ndarray:
+        """
+        全行とクエリベクトルのコサイン類似度を計算
+
+        Args:
+            query_vector: クエリベクトル（1536次元）
+
+        Returns:
+            np.ndarray: (N,) の類似度
+        """
+        query = np.asarray(query_vector, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return np.zeros(len(self), dtype=np.float32)
+        query = query / norm
+
+        if self.scales is None:
+            return self.embeddings @ query
+
+        # int8行列をそのままfloat32のクエリと掛けると全体がfloat32に変換された
+        # 一時配列が作られるため、キャッシュに収まる行数ずつ変換して内積を取る
+        # （NumPyの整数の行列積はBLASを使わずfloat32より遅い）
+        scores = np.empty(len(self), dtype=np.float32)
+        block = np.empty((_SIMILARITY_BLOCK_ROWS, self.embeddings.shape[1]), np.float32)
+        for start in range(0, len(self), _SIMILARITY_BLOCK_ROWS):
+            rows = self.embeddings[start : start + _SIMILARITY_BLOCK_ROWS]
+            converted = block[: len(rows)]
+            converted[...] = rows
+            np.dot(converted, query, out=scores[start : start + len(rows)])
+        # 量子化値の内積に行ごとのスケールを掛けて元のスケールに戻す
+        scores *= self.scales
+        return scores
+
+    def top_k(
+        self,
+        query_vector: Union[List[float], np.ndarray],
+        k: int = 5,
+        threshold: Optional[float] = None,
+    ) -> List[Tuple[EmojiData, float]]:
+        """
+        クエリベクトルに最も類似する絵文字を取得
+
+        全件ソートを避け、argpartitionで上位k件を選んでからその範囲のみ並べ替えます。
+
+        Args:
+            query_vector: クエリベクトル（1536次元）
+            k: 取得件数
+            threshold: 類似度の下限（任意）
+
+        Returns:
+            List[Tuple[EmojiData, float]]: 類似度の降順に並んだ (絵文字, 類似度)
+        """
+        if k <= 0 or len(self) == 0:
+            return []
+
+        scores = self.similarities(query_vector)
+        if k < len(scores):
+            candidates = np.argpartition(scores, -k)[-k:]
+        else:
+            candidates = np.arange(len(scores))
+        ordered = candidates[np.argsort(scores[candidates])[::-1]]
+
+        results = []
+        for index in ordered:
+            score = float(scores[index])
+            if threshold is not None and score < threshold:
+                break
+            results.append((self.emojis[index], score))
+        return results
+
+
+def _quantize_rows(embeddings: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    行ごとに最大絶対値が127になるスケールでint8に量子化
+
+    Args:
+        embeddings: (N, D) float32行列
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (N, D) int8の量子化値と (N,) float32のスケール
+    """
+    scales = (np.abs(embeddings).max(axis=1) / 127).astype(np.float32)
+    # ゼロベクトルの行はスケール1（量子化値はすべて0）
+    scales[scales == 0] = 1
+    quantized = np.round(embeddings / scales[:, np.newaxis]).astype(np.int8)
+    return quantized, scales
@@ -6,9 +6,21 @@ TDD GREEN Phase: 最小限の実装でテストを通す
 絵文字データの管理とベクトル類似度検索を提供します。
 """
 
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+import asyncio
+import json
+import os
+import sys
 import time
 
+import numpy as np
+
+try:
+    import ijson  # type: ignore[import-untyped,import-not-found]
+except ImportError:  # ijson is optional; JSON files are then parsed in one go
+    ijson = None
+
 from app.models.emoji import EmojiData
 from app.utils.logging import get_logger, log_execution_time, LogContext, metrics_logger
 from app.utils.error_handler import (
@@ -21,6 +33,70 @@ from app.utils.error_handler import (
 
 logger = get_logger("emoji_service")
 
+# JSONファイルから読み込んだ絵文字を1度に処理（保存）する件数
+JSON_LOAD_CHUNK_SIZE = 500
+
+# vectorize_all_emojis で1リクエストにまとめる件数と、同時に投げるリクエスト数
+EMBEDDING_BATCH_SIZE = 256
+EMBEDDING_MAX_CONCURRENT_BATCHES = 4
+
+
+def _iter_json_items(file_path: str) -> Iterator[Dict[str, Any]]:
+    """JSON配列ファイルの要素を1件ずつ返す
+
+    ijsonがインストールされている場合はファイル全体を読み込まずに
+    ストリーミングで解析します。
+
+    Raises:
+        FileNotFoundError: ファイルが存在しない場合
+        ValueError: JSONとして不正、またはルートが配列でない場合
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File not found: {file_path}")
+
+    if ijson is None:
+        with open(file_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, list):
+            raise ValueError("JSON file must contain a list of emoji data")
+        yield from data
+        return
+
+    with open(file_path, "rb") as f:
+        try:
+            events = ijson.parse(f)
+            # ルートが配列でない場合、ijson.itemsは何も返さずに終わるため先に確認
+            _, event, _ = next(events, ("", None, None))
+            if event != "start_array":
+                # json.loadと同様、構文エラーがあればそちらを優先して報告する
+                for _ in events:
+                    pass
+                raise ValueError("JSON file must contain a list of emoji data")
+            f.seek(0)
+            yield from ijson.items(f, "item", use_float=True)
+        except ijson.JSONError as e:
+            raise ValueError(f"Invalid JSON format in file {file_path}: {e}") from e
+
+
+def _chunked(
+    items: Iterator[Dict[str, Any]], size: int
+) -> Iterator[List[Dict[str, Any]]]:
+    """イテレータをsize件ずつのリストに分割"""
+    while chunk := list(islice(items, size)):
+        yield chunk
+
+
+def _estimated_size(emoji: EmojiData) -> int:
+    """キャッシュ内の絵文字1件のおおよそのバイト数（埋め込みのバッファを含む）"""
+    size = (
+        sys.getsizeof(emoji)
+        + sys.getsizeof(emoji.code)
+        + sys.getsizeof(emoji.description)
+    )
+    if emoji.embedding is not None:
+        size += emoji.embedding.nbytes
+    return size
+
 
 class EmojiServiceError(ApplicationError):
     """Emoji service specific error"""
@@ -54,6 +130,13 @@ class EmojiService:
         self.cache_enabled = cache_enabled
         self.cache_ttl = cache_ttl
         self.emoji_cache: Dict[str, EmojiData] = {}
+        # emoji_cacheのID→コードの逆引き（get_emoji_by_idで全件を走査しないため）
+        self._id_index: Dict[int, str] = {}
+        # emoji_cacheの推定バイト数（統計取得のたびに全件を走査しないため）
+        self._cache_bytes = 0
+        # 追加時に見積もったコードごとのバイト数（キャッシュ中の絵文字は変更され
+        # 得るため、削除時は見積もり直さずにこの値を差し引く）
+        self._cache_sizes: Dict[str, int] = {}
         self.cache_loaded = False
         self.cache_last_update = 0
         self.openai_service = None  # Will be set later
@@ -76,7 +159,8 @@ class EmojiService:
         logger.info("Loading initial emoji data...")
         try:
             # Check if emojis already exist in database
-            count = await self.database_service.count_emojis()
+            # (exact count: the estimate may still be 0 right after a load)
+            count = await self.database_service.count_emojis(exact=True)
             if count > 0:
                 logger.info(
                     f"Database already contains {count} emojis, skipping initial load"
@@ -96,7 +180,7 @@ class EmojiService:
     @log_execution_time(logger)
     async def find_similar_emojis(
         self,
-        query_vector: List[float],
+        query_vector: Union[Sequence[float], np.ndarray],
         limit: int = 3,
         filters: Optional[Dict[str, Any]] = None,
     ) -> List[EmojiData]:
@@ -159,7 +243,7 @@ class EmojiService:
 
             # キャッシュに保存
             if emoji and self.cache_enabled:
-                self.emoji_cache[code] = emoji
+                self._cache_emoji(emoji)
 
             return emoji
 
@@ -183,7 +267,7 @@ class EmojiService:
 
             # キャッシュに保存
             for emoji in emojis:
-                self.emoji_cache[emoji.code] = emoji
+                self._cache_emoji(emoji)
 
             self.cache_loaded = True
             logger.info(f"Loaded {len(emojis)} emojis into cache")
@@ -193,6 +277,24 @@ class EmojiService:
             logger.error(f"Error loading emoji cache: {e}")
             return 0
 
+    def _cache_emoji(self, emoji: EmojiData) -> None:
+        """絵文字をキャッシュに追加（IDからの逆引きと推定サイズも更新）"""
+        size = _estimated_size(emoji)
+        self._cache_bytes += size - self._cache_sizes.get(emoji.code, 0)
+        self._cache_sizes[emoji.code] = size
+        self.emoji_cache[emoji.code] = emoji
+        if emoji.id is not None:
+            self._id_index[emoji.id] = emoji.code
+
+    def _uncache_emoji(self, code: str) -> None:
+        """絵文字をキャッシュから削除（IDからの逆引きと推定サイズも更新）"""
+        emoji = self.emoji_cache.pop(code, None)
+        if emoji is None:
+            return
+        self._cache_bytes -= self._cache_sizes.pop(code, 0)
+        if emoji.id is not None:
+            self._id_index.pop(emoji.id, None)
+
     def get_cache_stats(self) -> Dict[str, Any]:
         """
         キャッシュ統計情報を取得
@@ -204,21 +306,28 @@ class EmojiService:
             "cache_enabled": self.cache_enabled,
             "cache_loaded": self.cache_loaded,
             "cached_emojis": len(self.emoji_cache),
-            "cache_size_mb": len(str(self.emoji_cache)) / (1024 * 1024),
+            "cache_size_mb": self._cache_bytes / (1024 * 1024),
         }
 
     # Basic CRUD operations (テストを通すための最小限実装)
 
     async def save_emoji(self, emoji_data: EmojiData) -> EmojiData:
-        """絵文字データを保存"""
-        return await self.database_service.insert_emoji(emoji_data)
+        """絵文字データを保存（保存後の読み直しが不要になるようキャッシュにも追加）"""
+        saved_emoji = await self.database_service.insert_emoji(emoji_data)
+
+        if self.cache_enabled:
+            self._cache_emoji(saved_emoji)
+
+        return saved_emoji
 
     async def get_emoji_by_id(self, emoji_id: int) -> Optional[EmojiData]:
         """IDで絵文字データを取得"""
-        # キャッシュから検索
+        # キャッシュから検索（逆引きが古い場合に備えてIDを確認する）
         if self.cache_enabled:
-            for emoji in self.emoji_cache.values():
-                if emoji.id == emoji_id:
+            code = self._id_index.get(emoji_id)
+            if code is not None:
+                emoji = self.emoji_cache.get(code)
+                if emoji is not None and emoji.id == emoji_id:
                     return emoji
 
         # データベースから取得
@@ -226,7 +335,7 @@ class EmojiService:
 
         # キャッシュに保存
         if emoji and self.cache_enabled:
-            self.emoji_cache[emoji.code] = emoji
+            self._cache_emoji(emoji)
 
         return emoji
 
@@ -235,24 +344,33 @@ class EmojiService:
         result = await self.database_service.update_emoji(emoji_data)
 
         # キャッシュから削除（無効化）
-        if self.cache_enabled and emoji_data.code in self.emoji_cache:
-            del self.emoji_cache[emoji_data.code]
+        if self.cache_enabled:
+            self._uncache_emoji(emoji_data.code)
 
         return result
 
     async def delete_emoji(self, emoji_id: int) -> bool:
         """絵文字データを削除"""
-        return await self.database_service.delete_emoji(emoji_id)
+        success = await self.database_service.delete_emoji(emoji_id)
+
+        # キャッシュから削除
+        code = self._id_index.get(emoji_id)
+        if success and code is not None:
+            self._uncache_emoji(code)
+
+        return success
 
     async def get_all_emojis(
-        self, limit: int = 100, offset: int = 0
+        self, limit: int = 100, offset: int = 0, after_id: Optional[int] = None
     ) -> List[EmojiData]:
-        """全絵文字を取得"""
-        return await self.database_service.get_all_emojis(limit=limit, offset=offset)
+        """全絵文字を取得（次のページはafter_idに直前の最後のIDを渡す）"""
+        return await self.database_service.get_all_emojis(
+            limit=limit, offset=offset, after_id=after_id
+        )
 
-    async def count_emojis(self) -> int:
-        """絵文字の総数を取得"""
-        return await self.database_service.count_emojis()
+    async def count_emojis(self, exact: bool = False) -> int:
+        """絵文字の総数を取得（exact=Falseの場合は統計情報からの推定値）"""
+        return await self.database_service.count_emojis(exact=exact)
 
     async def find_similar_emojis_by_text(
         self, text: str, limit: int = 3
@@ -266,14 +384,18 @@ class EmojiService:
     # Business Logic methods
 
     async def get_emojis_by_category(self, category: str) -> List[EmojiData]:
-        """カテゴリで絵文字を取得"""
-        all_emojis = await self.get_all_emojis(limit=10000)
-        return [emoji for emoji in all_emojis if emoji.category == category]
+        """カテゴリで絵文字を取得（埋め込みは含まない、必要ならload_embeddingsで取得）"""
+        return await self.database_service.get_emojis_filtered(category=category)
 
     async def get_emojis_by_emotion_tone(self, emotion_tone: str) -> List[EmojiData]:
-        """感情トーンで絵文字を取得"""
-        all_emojis = await self.get_all_emojis(limit=10000)
-        return [emoji for emoji in all_emojis if emoji.emotion_tone == emotion_tone]
+        """感情トーンで絵文字を取得（埋め込みは含まない、必要ならload_embeddingsで取得）"""
+        return await self.database_service.get_emojis_filtered(
+            emotion_tone=emotion_tone
+        )
+
+    async def load_embeddings(self, emojis: List[EmojiData]) -> None:
+        """埋め込みを持たない絵文字に埋め込みベクトルを一括で読み込む"""
+        await self.database_service.load_embeddings(emojis)
 
     async def get_emoji_stats(self) -> Dict[str, Any]:
         """絵文字統計を取得"""
@@ -367,71 +489,77 @@ class EmojiService:
         """絵文字データのバルク保存"""
         return await self.database_service.batch_insert_emojis(emoji_list)
 
-    async def load_emojis_from_json_file(self, file_path: str) -> int:
-        """JSONファイルから絵文字を読み込み"""
-        try:
-            import json
-            import os
+    async def bulk_update_emojis(self, emoji_list: List[EmojiData]) -> List[EmojiData]:
+        """絵文字データのバルク更新"""
+        result = await self.database_service.batch_update_emojis(emoji_list)
 
-            if not os.path.exists(file_path):
-                raise FileNotFoundError(f"File not found: {file_path}")
+        # キャッシュから削除（無効化）
+        if self.cache_enabled:
+            for emoji_data in emoji_list:
+                self._uncache_emoji(emoji_data.code)
 
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+        return result
 
-            if not isinstance(data, list):
-                raise ValueError("JSON file must contain a list of emoji data")
+    def _build_emojis_from_items(self, items: List[Dict[str, Any]]) -> List[EmojiData]:
+        """辞書のリストからEmojiDataを作成（埋め込みベクトルは一括検証）"""
+        embedded = [
+            i for i, item in enumerate(items) if item.get("embedding") is not None
+        ]
+        embeddings = EmojiData.validate_embeddings_batch(
+            [items[i]["embedding"] for i in embedded]
+        )
+        # 検証済みの行ビューを渡すことで、行ごとの変換コピーを避ける
+        embedding_by_index = dict(zip(embedded, embeddings))
+
+        return [
+            EmojiData(
+                # 欠けている場合は空文字として検証し "... is required" で失敗させる
+                code=item.get("code", ""),
+                description=item.get("description", ""),
+                category=item.get("category"),
+                emotion_tone=item.get("emotion_tone"),
+                usage_scene=item.get("usage_scene"),
+                priority=item.get("priority", 1),
+                embedding=embedding_by_index.get(i),
+            )
+            for i, item in enumerate(items)
+        ]
 
-            emojis = []
-            for item in data:
-                emoji_data = EmojiData(
-                    code=item.get("code"),
-                    description=item.get("description"),
-                    category=item.get("category"),
-                    emotion_tone=item.get("emotion_tone"),
-                    usage_scene=item.get("usage_scene"),
-                    priority=item.get("priority", 1),
-                    embedding=item.get("embedding"),
-                )
-                emojis.append(emoji_data)
+    async def load_emojis_from_json_file(self, file_path: str) -> int:
+        """JSONファイルから絵文字を読み込み、チャンクごとに保存
 
-            # バルク保存
-            saved_emojis = await self.bulk_save_emojis(emojis)
+        ファイルはストリーミングで解析・検証してからチャンク単位で投入します。
+        解析・検証はトランザクションを開く前に別スレッドで済ませ、全チャンクを
+        1つのトランザクションで保存するため、途中で不正なデータや壊れたJSONが
+        見つかった場合は何も保存されません。
+        """
+        try:
+            if not os.path.exists(file_path):
+                raise FileNotFoundError(f"File not found: {file_path}")
+
+            chunks = await asyncio.to_thread(self._build_emoji_chunks, file_path)
+            saved_count = await self.database_service.batch_insert_emoji_chunks(chunks)
 
-            logger.info(f"Loaded {len(saved_emojis)} emojis from {file_path}")
-            return len(saved_emojis)
+            logger.info(f"Loaded {saved_count} emojis from {file_path}")
+            return saved_count
 
         except Exception as e:
             logger.error(f"Error loading emojis from JSON file {file_path}: {e}")
             raise
 
+    def _build_emoji_chunks(self, file_path: str) -> List[List[EmojiData]]:
+        """JSONファイルを解析・検証し、投入用のチャンクに分割"""
+        return [
+            self._build_emojis_from_items(items)
+            for items in _chunked(_iter_json_items(file_path), JSON_LOAD_CHUNK_SIZE)
+        ]
+
     async def load_emojis_from_json(self, file_path: str) -> List[EmojiData]:
         """JSONファイルから絵文字を読み込み（エイリアス）"""
         try:
-            import json
-            import os
-
-            if not os.path.exists(file_path):
-                raise FileNotFoundError(f"File not found: {file_path}")
-
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            if not isinstance(data, list):
-                raise ValueError("JSON file must contain a list of emoji data")
-
-            emojis = []
-            for item in data:
-                emoji_data = EmojiData(
-                    code=item.get("code"),
-                    description=item.get("description"),
-                    category=item.get("category"),
-                    emotion_tone=item.get("emotion_tone"),
-                    usage_scene=item.get("usage_scene"),
-                    priority=item.get("priority", 1),
-                    embedding=item.get("embedding"),
-                )
-                emojis.append(emoji_data)
+            emojis: List[EmojiData] = []
+            for items in _chunked(_iter_json_items(file_path), JSON_LOAD_CHUNK_SIZE):
+                emojis.extend(self._build_emojis_from_items(items))
 
             logger.info(f"Loaded {len(emojis)} emojis from {file_path}")
             return emojis
@@ -439,9 +567,7 @@ class EmojiService:
         except Exception as e:
             logger.error(f"Error loading emojis from JSON file {file_path}: {e}")
             # Re-raise with more specific error messages for better test compatibility
-            if "Expecting value" in str(e) or "JSONDecodeError" in str(
-                type(e).__name__
-            ):
+            if isinstance(e, json.JSONDecodeError):
                 raise ValueError(f"Invalid JSON format in file {file_path}: {e}")
             raise
 
@@ -504,9 +630,6 @@ class EmojiService:
             # Generate embedding for the search text
             embedding = await self.openai_service.get_embedding(text)
 
-            # Convert numpy array to list for database query
-            query_vector = embedding.tolist()
-
             # Build filters if provided
             filters = {}
             if category:
@@ -514,9 +637,9 @@ class EmojiService:
             if emotion_tone:
                 filters["emotion_tone"] = emotion_tone
 
-            # Search for similar emojis
+            # Search for similar emojis (numpy arrays are bound without a list copy)
             results = await self._db_service.find_similar_emojis(
-                query_vector, limit=limit, filters=filters if filters else None
+                embedding, limit=limit, filters=filters if filters else None
             )
 
             return results
@@ -548,9 +671,12 @@ class EmojiService:
             # Search for each embedding
             batch_results = []
             for embedding in embeddings:
-                query_vector = embedding.tolist()
+                # No results for texts whose embedding could not be generated
+                if embedding is None:
+                    batch_results.append([])
+                    continue
                 results = await self._db_service.find_similar_emojis(
-                    query_vector, limit=limit
+                    embedding, limit=limit
                 )
                 batch_results.append(results)
 
@@ -575,7 +701,8 @@ class EmojiService:
             skip_on_error: If True, return None on error instead of raising
 
         Returns:
-            Dict with embedding and metadata, or None if skip_on_error and error occurs
+            Dict with embedding (numpy array) and metadata, or None if
+            skip_on_error and error occurs
         """
         if not self.openai_service:
             raise RuntimeError("OpenAI service not configured")
@@ -591,7 +718,7 @@ class EmojiService:
                 return {
                     "id": emoji.id,
                     "code": emoji.code,
-                    "embedding": embedding.tolist(),
+                    "embedding": embedding,
                     "model": metadata.get("model", model),
                     "usage": metadata.get("usage"),
                 }
@@ -601,7 +728,7 @@ class EmojiService:
                 return {
                     "id": emoji.id,
                     "code": emoji.code,
-                    "embedding": embedding.tolist(),
+                    "embedding": embedding,
                 }
 
         except Exception as e:
@@ -618,6 +745,10 @@ class EmojiService:
         """
         Vectorize multiple emojis in batches
 
+        Embedding requests and database writes run as a producer/consumer
+        pipeline, so the next batch is fetched from OpenAI while the previous
+        one is being written.
+
         Args:
             batch_size: Number of emojis to process in each batch
             continue_on_error: If True, continue processing on batch errors
@@ -633,34 +764,66 @@ class EmojiService:
 
         successful = 0
         failed = 0
-        embedding_updates = {}
-
-        # Process in batches
-        for i in range(0, len(all_emojis), batch_size):
-            batch = all_emojis[i : i + batch_size]
-            descriptions = [emoji.description for emoji in batch]
+        # Bounded so the producer stays at most a couple of batches ahead
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2)
 
+        async def produce() -> None:
+            nonlocal failed
             try:
-                # Get embeddings for batch
-                embeddings = await self.openai_service.get_embeddings_batch(
-                    descriptions
-                )
-
-                # Prepare updates
-                for emoji, embedding in zip(batch, embeddings):
-                    embedding_updates[emoji.id] = embedding.tolist()
-                    successful += 1
-
-                # Update database
-                if embedding_updates:
-                    await self._db_service.batch_update_embeddings(embedding_updates)
-                    embedding_updates.clear()
-
-            except Exception as e:
-                logger.error(f"Error processing batch {i // batch_size + 1}: {e}")
-                failed += len(batch)
-                if not continue_on_error:
-                    raise
+                for i in range(0, len(all_emojis), batch_size):
+                    batch = all_emojis[i : i + batch_size]
+                    descriptions = [emoji.description for emoji in batch]
+                    try:
+                        embeddings = await self.openai_service.get_embeddings_batch(
+                            descriptions
+                        )
+                    except Exception as e:
+                        logger.error(
+                            f"Error processing batch {i // batch_size + 1}: {e}"
+                        )
+                        failed += len(batch)
+                        if not continue_on_error:
+                            raise
+                        continue
+                    await queue.put((i // batch_size + 1, batch, embeddings))
+            except Exception:
+                # Let the consumer write what has already been queued
+                await queue.put(None)
+                raise
+            await queue.put(None)
+
+        async def consume() -> None:
+            nonlocal successful, failed
+            while (item := await queue.get()) is not None:
+                batch_number, batch, embeddings = item
+                embedding_updates = {
+                    emoji.id: embedding
+                    for emoji, embedding in zip(batch, embeddings)
+                    if embedding is not None
+                }
+                # Texts the API could not embed are not written
+                failed += len(batch) - len(embedding_updates)
+                try:
+                    if embedding_updates:
+                        await self._db_service.batch_update_embeddings(
+                            embedding_updates
+                        )
+                    successful += len(embedding_updates)
+                except Exception as e:
+                    logger.error(f"Error processing batch {batch_number}: {e}")
+                    failed += len(embedding_updates)
+                    if not continue_on_error:
+                        raise
+
+        producer = asyncio.create_task(produce())
+        try:
+            await consume()
+        except BaseException:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+            raise
+        # Re-raise an embedding error from the producer, if any
+        await producer
 
         return {"successful": successful, "failed": failed}
 
@@ -688,33 +851,17 @@ class EmojiService:
         if not self.openai_service:
             raise RuntimeError("OpenAI service not configured")
 
-        # Get all emojis
-        all_emojis = await self._db_service.get_all_emojis(limit=10000)
-
-        # Apply filters
-        filtered_emojis = []
-        filtered_out = 0
-
-        for emoji in all_emojis:
-            # Skip if has embedding and skip_existing is True
-            if skip_existing and emoji.embedding is not None:
-                continue
-
-            # Apply category filter
-            if category and emoji.category != category:
-                filtered_out += 1
-                continue
-
-            # Apply emotion tone filter
-            if emotion_tone and emoji.emotion_tone != emotion_tone:
-                filtered_out += 1
-                continue
-
-            filtered_emojis.append(emoji)
+        # Filter in the database so only emojis that need work are fetched
+        filtered_emojis, counts = await self._db_service.get_emojis_for_vectorization(
+            skip_existing=skip_existing,
+            category=category,
+            emotion_tone=emotion_tone,
+        )
+        skipped = counts["skipped"]
+        filtered_out = counts["filtered_out"]
 
         total = len(filtered_emojis)
         processed = 0
-        skipped = len(all_emojis) - len(filtered_emojis) - filtered_out
 
         if dry_run:
             return {
@@ -724,22 +871,54 @@ class EmojiService:
                 "filtered_out": filtered_out,
             }
 
-        # Process emojis
-        embedding_updates = {}
-        for idx, emoji in enumerate(filtered_emojis):
-            try:
-                # Get embedding
-                embedding = await self.openai_service.get_embedding(emoji.description)
-                embedding_updates[emoji.id] = embedding.tolist()
+        # Process emojis in chunks, with a few embedding requests in flight
+        embedding_updates: Dict[int, np.ndarray] = {}
+        semaphore = asyncio.Semaphore(EMBEDDING_MAX_CONCURRENT_BATCHES)
+
+        async def vectorize_chunk(chunk: List[EmojiData]) -> None:
+            nonlocal processed
+            async with semaphore:
+                embeddings: List[Optional[np.ndarray]]
+                try:
+                    embeddings = list(
+                        await self.openai_service.get_embeddings_batch(
+                            [emoji.description for emoji in chunk]
+                        )
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"Error vectorizing {chunk[0].code}..{chunk[-1].code}: {e}"
+                    )
+                    embeddings = [None] * len(chunk)
+
+                # Retry the emojis the batch could not embed one at a time
+                for i, emoji in enumerate(chunk):
+                    if embeddings[i] is not None:
+                        continue
+                    try:
+                        embeddings[i] = await self.openai_service.get_embedding(
+                            emoji.description
+                        )
+                    except Exception as e:
+                        logger.error(f"Error vectorizing {emoji.code}: {e}")
+
+            for emoji, embedding in zip(chunk, embeddings):
+                # Failed emojis keep their current embedding and are not counted
+                if embedding is None:
+                    continue
+                embedding_updates[emoji.id] = embedding
                 processed += 1
 
                 # Call progress callback
                 if progress_callback:
-                    progress_callback(idx + 1, total, emoji.code)
+                    progress_callback(processed, total, emoji.code)
 
-            except Exception as e:
-                logger.error(f"Error vectorizing {emoji.code}: {e}")
-                continue
+        await asyncio.gather(
+            *(
+                vectorize_chunk(filtered_emojis[i : i + EMBEDDING_BATCH_SIZE])
+                for i in range(0, total, EMBEDDING_BATCH_SIZE)
+            )
+        )
 
         # Update database
         if embedding_updates and not dry_run:
@@ -749,11 +928,11 @@ class EmojiService:
             "processed": processed,
             "skipped": skipped,
             "filtered_out": filtered_out,
-            "total": len(all_emojis),
+            "total": counts["total"],
         }
 
     async def update_emoji_embeddings(
-        self, embedding_updates: Dict[int, List[float]]
+        self, embedding_updates: Dict[int, Union[List[float], np.ndarray]]
     ) -> bool:
         """
         Update emoji embeddings in database
@@ -792,6 +971,9 @@ class EmojiService:
             if isinstance(error, EmojiServiceError) and "cache" in str(error).lower():
                 logger.warning("Cache error detected, clearing cache")
                 self.emoji_cache.clear()
+                self._id_index.clear()
+                self._cache_sizes.clear()
+                self._cache_bytes = 0
                 self.cache_last_update = 0
             return None
 
@@ -802,7 +984,7 @@ class EmojiService:
     @create_circuit_breaker(failure_threshold=5, timeout_seconds=60, logger=logger)
     async def _find_similar_emojis_with_circuit_breaker(
         self,
-        query_vector: List[float],
+        query_vector: Union[Sequence[float], np.ndarray],
         limit: int = 3,
         filters: Optional[Dict[str, Any]] = None,
     ) -> List[EmojiData]:
@@ -912,8 +1094,8 @@ class EmojiService:
             success = await self._db_service.delete_emoji(emoji.id)
 
             # キャッシュから削除
-            if success and emoji_code in self.emoji_cache:
-                del self.emoji_cache[emoji_code]
+            if success:
+                self._uncache_emoji(emoji_code)
 
             return success
         except Exception as e:
@@ -945,6 +1127,6 @@ class EmojiService:
 
         # キャッシュに追加
         if self.cache_enabled:
-            self.emoji_cache[saved_emoji.code] = saved_emoji
+            self._cache_emoji(saved_emoji)
 
         return saved_emoji
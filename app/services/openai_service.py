@@ -200,7 +200,9 @@ class OpenAIService:
 
     @with_error_handling(logger=logger, reraise=True)
     @log_execution_time(logger)
-    async def get_embeddings_batch(self, texts: List[str]) -> List[np.ndarray]:
+    async def get_embeddings_batch(
+        self, texts: List[str]
+    ) -> List[Optional[np.ndarray]]:
         """
         Generate embeddings for multiple texts
 
@@ -208,7 +210,8 @@ class OpenAIService:
             texts: List of input texts
 
         Returns:
-            List of embedding vectors
+            List of embedding vectors in input order; None for each text
+            whose embedding could not be generated
 
         Raises:
             ValueError: If any text is empty
@@ -224,7 +227,7 @@ class OpenAIService:
                     raise ValueError(f"Text at index {i} cannot be empty")
 
             # Process all texts
-            embeddings = []
+            embeddings: List[Optional[np.ndarray]] = []
             successful = 0
             failed = 0
 
@@ -251,8 +254,8 @@ class OpenAIService:
                             details={"successful": successful, "failed": failed},
                         )
 
-                    # Add zero embedding as placeholder
-                    embeddings.append(np.zeros(self.dimensions, dtype=np.float32))
+                    # Keep positions aligned without passing off a fake vector
+                    embeddings.append(None)
 
             if failed > 0:
                 logger.warning(
@@ -0,0 +1,151 @@
+"""
+類似度キャッシュユーティリティ
+
+直近のクエリベクトルと検索結果を保持し、十分に近いクエリが来た場合は
+ベクトル検索を行わずにキャッシュした結果を返す機能を提供
+"""
+
+import copy
+from typing import Any, Dict, Hashable, List, Optional
+
+import numpy as np
+
+
+class SimilarityCache:
+    """
+    クエリベクトルをキーとするLRUキャッシュ
+
+    キーのベクトルは (max_size, dimension) の連続したfloat32行列に保持し、
+    1回の行列ベクトル積で全キーとのコサイン類似度を求めます。
+    検索条件（絞り込みや件数）が異なる結果を取り違えないよう、
+    各エントリはcontextが一致する場合のみヒットします。
+
+    結果は保存時・取得時にディープコピーするため、呼び出し側で結果を
+    変更してもキャッシュには影響しません。clearのたびに世代番号が進み、
+    clear前に取得した世代番号を指定したputは無視されます。
+    """
+
+    def __init__(
+        self, max_size: int = 1024, threshold: float = 0.97, dimension: int = 1536
+    ):
+        """初期化
+
+        Args:
+            max_size: 保持するエントリ数の上限
+            threshold: ヒットとみなすコサイン類似度の下限
+            dimension: クエリベクトルの次元数
+        """
+        self.max_size = max_size
+        self.threshold = threshold
+        self.dimension = dimension
+        self.hits = 0
+        self.misses = 0
+
+        # キー行列は最初のputで確保する（使われない場合に確保しない）
+        self._vectors: Optional[np.ndarray] = None
+        # 各スロットのcontext番号（-1は空きスロット）と最終利用時刻
+        self._contexts = np.full(max_size, -1, dtype=np.int64)
+        self._last_used = np.full(max_size, -1, dtype=np.int64)
+        self._results: List[Any] = [None] * max_size
+        self._context_ids: Dict[Hashable, int] = {}
+        self._next_context_id = 0
+        self._clock = 0
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """現在の世代番号（clearのたびに増える）"""
+        return self._generation
+
+    def __len__(self) -> int:
+        """保持しているエントリ数"""
+        return int(np.count_nonzero(self._contexts >= 0))
+
+    def get(self, unit_vector: np.ndarray, context: Hashable) -> Optional[Any]:
+        """キャッシュから結果を取得
+
+        Args:
+            unit_vector: L2正規化済みのクエリベクトル
+            context: 検索条件を表すハッシュ可能な値
+
+        Returns:
+            Optional[Any]: ヒットした場合は保存した結果のコピー、それ以外はNone
+        """
+        context_id = self._context_ids.get(context)
+        if context_id is not None and self._vectors is not None:
+            scores = self._vectors @ unit_vector
+            scores[self._contexts != context_id] = -np.inf
+            slot = int(np.argmax(scores))
+            if scores[slot] >= self.threshold:
+                self._clock += 1
+                self._last_used[slot] = self._clock
+                self.hits += 1
+                return copy.deepcopy(self._results[slot])
+
+        self.misses += 1
+        return None
+
+    def put(
+        self,
+        unit_vector: np.ndarray,
+        context: Hashable,
+        result: Any,
+        generation: Optional[int] = None,
+    ) -> None:
+        """結果をキャッシュに保存（満杯の場合は最も長く使われていないものを置き換え）
+
+        Args:
+            unit_vector: L2正規化済みのクエリベクトル
+            context: 検索条件を表すハッシュ可能な値
+            result: 保存する結果
+            generation: 結果を取得する前のgeneration。その後にclearされていれば
+                古い結果の可能性があるため保存しない
+        """
+        if generation is not None and generation != self._generation:
+            return
+
+        if self._vectors is None:
+            self._vectors = np.zeros((self.max_size, self.dimension), dtype=np.float32)
+
+        context_id = self._context_ids.get(context)
+        if context_id is None:
+            if len(self._context_ids) >= self.max_size:
+                self._prune_contexts()
+            context_id = self._next_context_id
+            self._next_context_id += 1
+            self._context_ids[context] = context_id
+        slot = int(np.argmin(self._last_used))
+
+        self._clock += 1
+        self._vectors[slot] = unit_vector
+        self._contexts[slot] = context_id
+        self._last_used[slot] = self._clock
+        self._results[slot] = copy.deepcopy(result)
+
+    def _prune_contexts(self) -> None:
+        """どのスロットからも参照されていないcontextを破棄"""
+        live = set(self._contexts[self._contexts >= 0].tolist())
+        self._context_ids = {
+            context: context_id
+            for context, context_id in self._context_ids.items()
+            if context_id in live
+        }
+
+    def clear(self) -> None:
+        """全エントリを破棄（データ更新時に呼び出す）"""
+        self._generation += 1
+        self._contexts.fill(-1)
+        self._last_used.fill(-1)
+        self._results = [None] * self.max_size
+        self._context_ids.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """キャッシュの統計情報を取得"""
+        total = self.hits + self.misses
+        return {
+            "size": len(self),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
@@ -13,13 +13,15 @@ CREATE TABLE emojis (
     emotion_tone VARCHAR(20),           -- positive/negative/neutral
     usage_scene VARCHAR(100),           -- usage context
     priority INTEGER DEFAULT 1,        -- weighting factor
-    embedding VECTOR(1536),             -- OpenAI embedding vector
+    embedding HALFVEC(1536),            -- OpenAI embedding vector (FP16)
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
 -- Create vector search index for performance
-CREATE INDEX ON emojis USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100);
+-- Embeddings are stored L2-normalized, so inner product ranks like cosine
+CREATE INDEX idx_emojis_embedding_hnsw_ip ON emojis
+    USING hnsw (embedding halfvec_ip_ops) WITH (m = 16, ef_construction = 64);
 
 -- Create indexes for common queries
 CREATE INDEX idx_emojis_category ON emojis(category);
@@ -14,6 +14,11 @@ import app.config
 class TestConfig:
     """Test configuration management functionality."""
 
+    def teardown_method(self):
+        """Reset singleton instance after each test."""
+        Config._instance = None
+        Config._loaded = False
+
     def test_config_import(self):
         """Test that config module can be imported."""
         # Config is already imported at the top of the file
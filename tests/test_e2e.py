@@ -115,6 +115,9 @@ class TestEndToEnd:
         db_service.batch_insert_emojis = AsyncMock(
             side_effect=lambda emojis: emojis  # Return the same emojis
         )
+        db_service.batch_insert_emoji_chunks = AsyncMock(
+            side_effect=lambda chunks: sum(len(chunk) for chunk in chunks)
+        )
         return db_service
 
     @pytest.fixture
@@ -162,12 +165,15 @@ class TestEndToEnd:
     ):
         """Test complete application startup sequence"""
         # Import main module to test startup
-        with patch("app.main.SlackHandler") as mock_handler_class, patch(
-            "app.main.DatabaseService"
+        # main() imports the services lazily, so patch them at their source
+        with patch(
+            "app.services.slack_handler.SlackHandler"
+        ) as mock_handler_class, patch(
+            "app.services.database_service.DatabaseService"
         ) as mock_db_service_class, patch(
-            "app.main.EmojiService"
+            "app.services.emoji_service.EmojiService"
         ) as mock_emoji_service_class, patch(
-            "app.main.OpenAIService"
+            "app.services.openai_service.OpenAIService"
         ) as mock_openai_service_class:
             # Create mock instances
             mock_handler = Mock()  # SlackHandler itself is not async
@@ -568,11 +574,8 @@ class TestEndToEnd:
             loaded = await emoji_service.load_emojis_from_json_file("data/emojis.json")
             assert loaded > 0  # Should have loaded at least one emoji
 
-        # Verify database operations were called - note the method name difference
-        assert (
-            mock_db_service.batch_insert_emojis.called
-            or mock_db_service.insert_emoji_batch.called
-        )
+        # Verify the emojis were saved in a single chunked insert
+        mock_db_service.batch_insert_emoji_chunks.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_rate_limiting_e2e(
@@ -66,6 +66,24 @@ class TestAdminUser:
         assert user_dict["created_at"] == now.isoformat()
         assert user_dict["updated_at"] == now.isoformat()
 
+    def test_to_dict_reflects_updated_timestamp(self):
+        """タイムスタンプ更新後の辞書変換テスト"""
+        now = datetime.now(UTC)
+        user = AdminUser(
+            user_id="U1234567890",
+            username="test_user",
+            permission=Permission.EDITOR,
+            created_at=now,
+            updated_at=now,
+        )
+        assert user.to_dict()["updated_at"] == now.isoformat()
+
+        later = datetime(2030, 1, 1, tzinfo=UTC)
+        user.updated_at = later
+        user_dict = user.to_dict()
+        assert user_dict["created_at"] == now.isoformat()
+        assert user_dict["updated_at"] == later.isoformat()
+
     def test_from_dict(self):
         """辞書からの変換テスト"""
         now = datetime.now(UTC)
@@ -17,6 +17,7 @@ EmojiDataクラスの期待される動作を定義します。
 - updated_at: TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 """
 
+import numpy as np
 import pytest
 from datetime import datetime
 
@@ -81,7 +82,7 @@ class TestEmojiData:
         assert emoji.emotion_tone == "positive"
         assert emoji.usage_scene == "approval"
         assert emoji.priority == 2
-        assert emoji.embedding == test_embedding
+        np.testing.assert_allclose(emoji.embedding, test_embedding, rtol=1e-6)
         assert emoji.created_at == test_created_at
         assert emoji.updated_at == test_updated_at
 
@@ -112,7 +113,7 @@ class TestEmojiDataValidation:
             assert emoji.code == code
 
         # 異常な形式でエラーが発生することを確認
-        invalid_codes = ["smile", ":smile", "smile:", "::smile::"]
+        invalid_codes = ["smile", ":smile", "smile:", "::smile::", "::", ":", ":a:b:"]
         for invalid_code in invalid_codes:
             with pytest.raises(ValueError, match="Invalid emoji code format"):
                 EmojiData(code=invalid_code, description="Test")
@@ -147,6 +148,15 @@ class TestEmojiDataValidation:
         with pytest.raises(ValueError, match="description is required"):
             EmojiData(code=":smile:", description=None)
 
+    def test_description_whitespace_stripped(self):
+        """説明文の前後の空白が除去されることを確認"""
+        from app.models.emoji import EmojiData
+
+        assert EmojiData(code=":smile:", description="  Happy\n").description == "Happy"
+        assert EmojiData(code=":smile:", description="Happy face").description == (
+            "Happy face"
+        )
+
     def test_emotion_tone_validation(self):
         """感情トーンの妥当性チェック"""
         from app.models.emoji import EmojiData
@@ -173,8 +183,13 @@ class TestEmojiDataValidation:
             emoji = EmojiData(code=":test:", description="Test", priority=priority)
             assert emoji.priority == priority
 
+        # NumPyの整数型も受け付け、intに正規化する
+        emoji = EmojiData(code=":test:", description="Test", priority=np.int64(3))
+        assert emoji.priority == 3
+        assert type(emoji.priority) is int
+
         # 無効な優先度でエラーが発生することを確認
-        invalid_priorities = [0, -1, 11, 100, "1", None]
+        invalid_priorities = [0, -1, 11, 100, "1", None, 1.0]
         for invalid_priority in invalid_priorities:
             with pytest.raises(ValueError, match="Invalid priority"):
                 EmojiData(code=":test:", description="Test", priority=invalid_priority)
@@ -186,7 +201,9 @@ class TestEmojiDataValidation:
         # 正しい次元数のベクトル（1536次元）
         valid_embedding = [0.1] * 1536
         emoji = EmojiData(code=":test:", description="Test", embedding=valid_embedding)
-        assert emoji.embedding == valid_embedding
+        assert isinstance(emoji.embedding, np.ndarray)
+        assert emoji.embedding.dtype == np.float32
+        np.testing.assert_allclose(emoji.embedding, valid_embedding, rtol=1e-6)
 
         # 間違った次元数でエラーが発生することを確認
         wrong_dimension_embeddings = [
@@ -200,6 +217,61 @@ class TestEmojiDataValidation:
             with pytest.raises(ValueError, match="Invalid embedding dimension"):
                 EmojiData(code=":test:", description="Test", embedding=wrong_embedding)
 
+        # 数値以外の要素はエラー
+        with pytest.raises(ValueError, match="only numeric values"):
+            EmojiData(code=":test:", description="Test", embedding=["x"] + [0.1] * 1535)
+
+        # NaN・無限大を含む場合もエラー（validate_embeddings_batchと同じ判定）
+        for value in (float("nan"), float("inf")):
+            with pytest.raises(ValueError, match="only finite values"):
+                EmojiData(
+                    code=":test:", description="Test", embedding=[value] + [0.1] * 1535
+                )
+
+    def test_embedding_to_dict_round_trip(self):
+        """ndarrayで保持した埋め込みが辞書変換でリストに戻ることを確認"""
+        from app.models.emoji import EmojiData
+
+        emoji = EmojiData(code=":test:", description="Test", embedding=[0.5] * 1536)
+        result = emoji.to_dict()
+
+        assert isinstance(result["embedding"], list)
+        assert result["embedding"] == [0.5] * 1536
+        assert emoji.is_valid() is True
+
+    def test_embedding_accepts_ndarray(self):
+        """ndarrayの埋め込みを連続したfloat32配列として保持することを確認"""
+        from app.models.emoji import EmojiData
+
+        # 非連続なfloat64のビューを渡す
+        source = np.arange(1536 * 2, dtype=np.float64)[::2]
+        emoji = EmojiData.from_dict(
+            {"code": ":test:", "description": "Test", "embedding": source}
+        )
+
+        assert emoji.embedding.dtype == np.float32
+        assert emoji.embedding.flags["C_CONTIGUOUS"]
+        np.testing.assert_allclose(emoji.embedding, source, rtol=1e-6)
+
+    def test_validate_embeddings_batch(self):
+        """埋め込みベクトルの一括検証テスト"""
+        from app.models.emoji import EmojiData
+
+        batch = EmojiData.validate_embeddings_batch([[0.1] * 1536, [0.2] * 1536])
+        assert batch.shape == (2, 1536)
+        assert batch.dtype == np.float32
+
+        assert EmojiData.validate_embeddings_batch([]).shape == (0, 1536)
+
+        with pytest.raises(ValueError, match="Invalid embedding dimension"):
+            EmojiData.validate_embeddings_batch([[0.1] * 1536, [0.1] * 100])
+
+        with pytest.raises(ValueError, match="only numeric values"):
+            EmojiData.validate_embeddings_batch([["x"] + [0.1] * 1535])
+
+        with pytest.raises(ValueError, match="only finite values"):
+            EmojiData.validate_embeddings_batch([[float("nan")] + [0.1] * 1535])
+
 
 class TestEmojiDataMethods:
     """EmojiDataクラスのメソッドテスト"""
@@ -261,10 +333,84 @@ class TestEmojiDataMethods:
         assert emoji.emotion_tone == "positive"
         assert emoji.usage_scene == "approval"
         assert emoji.priority == 2
-        assert emoji.embedding == data["embedding"]
+        np.testing.assert_allclose(emoji.embedding, data["embedding"], rtol=1e-6)
         assert emoji.created_at == data["created_at"]
         assert emoji.updated_at == data["updated_at"]
 
+    def test_from_record_class_method(self):
+        """信頼済み行データからの作成テスト"""
+        from app.models.emoji import EmojiData
+
+        now = datetime.now()
+        rows = [
+            (1, ":smile:", "Happy", "faces", "positive", "chat", 5, None, now, now),
+            (2, ":cry:", "Sad", None, "negative", None, 1, [0.5] * 1536, now, None),
+        ]
+
+        emojis = [EmojiData.from_record(row) for row in rows]
+
+        assert len(emojis) == 2
+        assert emojis[0] == EmojiData(
+            code=":smile:",
+            description="Happy",
+            category="faces",
+            emotion_tone="positive",
+            usage_scene="chat",
+            priority=5,
+        )
+        assert emojis[0].id == 1
+        assert emojis[0].embedding is None
+        assert emojis[1].embedding.dtype == np.float32
+        assert emojis[1].created_at == now
+        assert emojis[1].is_valid() is True
+
+    def test_slots_prevent_instance_dict(self):
+        """__slots__によりインスタンス辞書を持たないことを確認"""
+        from app.models.emoji import EmojiData
+
+        emoji = EmojiData(code=":test:", description="Test")
+
+        assert not hasattr(emoji, "__dict__")
+        assert not hasattr(emoji, "similarity_score")
+        emoji.similarity_score = 0.9
+        assert emoji.similarity_score == 0.9
+        with pytest.raises(AttributeError):
+            emoji.unknown_attribute = 1
+
+    def test_low_cardinality_strings_are_shared(self):
+        """同じ値の文字列フィールドが同一オブジェクトを共有することを確認"""
+        from app.models.emoji import EmojiData
+
+        # 実行時に生成した別オブジェクトの文字列を渡す
+        first = EmojiData(
+            code=":test:",
+            description="Test",
+            category="".join(["fa", "ces"]),
+            emotion_tone="".join(["posi", "tive"]),
+            usage_scene="".join(["ch", "at"]),
+        )
+        second = EmojiData.from_record(
+            (
+                None,
+                "".join([":te", "st:"]),
+                "Test",
+                "".join(["fac", "es"]),
+                "".join(["posit", "ive"]),
+                "".join(["cha", "t"]),
+                1,
+                None,
+                None,
+                None,
+            )
+        )
+
+        assert first.code is second.code
+        assert first.category is second.category
+        assert first.emotion_tone is second.emotion_tone
+        # 自由記述のusage_sceneはプールしない（値がプロセス内に残り続けないため）
+        assert first.usage_scene == second.usage_scene
+        assert first.usage_scene is not second.usage_scene
+
     def test_is_valid_method(self):
         """データ妥当性チェックメソッドテスト"""
         from app.models.emoji import EmojiData
@@ -276,6 +422,12 @@ class TestEmojiDataMethods:
         # 無効なデータ（実装によって検証される）
         # このテストは実装でどのような検証が行われるかを定義する
 
+        # 構築後に無効な値へ変更された場合は再検証される
+        valid_emoji.priority = 0
+        assert valid_emoji.is_valid() is False
+        valid_emoji.priority = 5
+        assert valid_emoji.is_valid() is True
+
     def test_str_and_repr_methods(self):
         """文字列表現メソッドテスト"""
         from app.models.emoji import EmojiData
@@ -291,6 +443,11 @@ class TestEmojiDataMethods:
         repr_result = repr(emoji)
         assert "EmojiData" in repr_result
         assert ":smile:" in repr_result
+        assert "description='Happy expression'," in repr_result
+
+        # 30文字を超える説明文は切り詰めて省略記号を付ける
+        long_emoji = EmojiData(code=":smile:", description="a" * 40)
+        assert f"description='{'a' * 30}...'," in repr(long_emoji)
 
 
 class TestEmojiDataComparison:
@@ -343,6 +500,21 @@ def sample_emoji_data():
         "updated_at": datetime.now(),
     }
 
+    def test_hash_follows_mutation(self):
+        """フィールド変更時にハッシュ値が更新されることを確認"""
+        from app.models.emoji import EmojiData
+
+        emoji = EmojiData(code=":test:", description="Test")
+        before = hash(emoji)
+        assert hash(emoji) == before
+
+        emoji.description = "Updated"
+        assert hash(emoji) == hash(EmojiData(code=":test:", description="Updated"))
+
+        # ハッシュ対象外のフィールドは影響しない
+        emoji.id = 10
+        assert hash(emoji) == hash(EmojiData(code=":test:", description="Updated"))
+
 
 class TestEmojiDataEdgeCases:
     """EmojiDataのエッジケーステスト"""
@@ -0,0 +1,100 @@
+"""
+EmojiTable モデル単体テスト
+
+EmojiDataのリストから作成した列指向テーブルでの類似度計算を検証します。
+"""
+
+import numpy as np
+import pytest
+
+from app.models.emoji import EmojiData
+from app.models.emoji_table import EmojiTable
+
+
+def _one_hot(index: int, scale: float = 1.0) -> list:
+    vector = [0.0] * 1536
+    vector[index] = scale
+    return vector
+
+
+@pytest.fixture
+def sample_emojis():
+    """埋め込みを持つ絵文字と持たない絵文字"""
+    return [
+        EmojiData(id=1, code=":smile:", description="Smile", embedding=_one_hot(0, 2)),
+        EmojiData(id=2, code=":cry:", description="Cry", embedding=_one_hot(1)),
+        EmojiData(code=":cat:", description="Cat", embedding=_one_hot(2)),
+        EmojiData(id=4, code=":dog:", description="Dog"),
+    ]
+
+
+class TestEmojiTable:
+    """EmojiTableの基本機能テスト"""
+
+    def test_from_emojis_skips_missing_embeddings(self, sample_emojis):
+        """埋め込みを持たない絵文字は除外される"""
+        table = EmojiTable.from_emojis(sample_emojis)
+
+        assert len(table) == 3
+        assert table.codes == [":smile:", ":cry:", ":cat:"]
+        assert table.ids.tolist() == [1, 2, -1]
+        assert table.embeddings.shape == (3, 1536)
+        assert table.embeddings.dtype == np.float32
+        # 行は正規化済み
+        np.testing.assert_allclose(np.linalg.norm(table.embeddings, axis=1), 1.0)
+        # 元の埋め込みは変更されない
+        assert sample_emojis[0].embedding[0] == 2.0
+
+    def test_empty_table(self):
+        """空のテーブルでは結果が空になる"""
+        for quantize in (False, True):
+            table = EmojiTable.from_emojis([], quantize=quantize)
+
+            assert len(table) == 0
+            assert table.top_k(_one_hot(0)) == []
+
+    def test_top_k_orders_by_similarity(self, sample_emojis):
+        """上位k件が類似度の降順で返される"""
+        table = EmojiTable.from_emojis(sample_emojis)
+        query = _one_hot(1, 0.5)
+        query[0] = 0.25
+
+        results = table.top_k(query, k=2)
+
+        assert [emoji.code for emoji, _ in results] == [":cry:", ":smile:"]
+        assert results[0][1] == pytest.approx(2 / np.sqrt(5), rel=1e-5)
+        assert results[0][1] >= results[1][1]
+
+    def test_top_k_with_threshold_and_large_k(self, sample_emojis):
+        """閾値未満の結果は除外され、kが行数を超えても動作する"""
+        table = EmojiTable.from_emojis(sample_emojis)
+
+        results = table.top_k(_one_hot(2), k=10, threshold=0.5)
+
+        assert [emoji.code for emoji, _ in results] == [":cat:"]
+        assert results[0][1] == pytest.approx(1.0)
+
+    def test_quantized_table(self, sample_emojis):
+        """int8量子化したテーブルでも同じ順位と近い類似度が得られる"""
+        rng = np.random.default_rng(0)
+        # ブロック単位の計算で端数のブロックも含まれる件数
+        emojis = [
+            EmojiData(
+                id=i,
+                code=f":emoji_{i}:",
+                description="Random",
+                embedding=rng.standard_normal(1536),
+            )
+            for i in range(300)
+        ]
+        query = emojis[3].embedding + 0.1 * rng.standard_normal(1536)
+
+        exact = EmojiTable.from_emojis(emojis)
+        quantized = EmojiTable.from_emojis(emojis, quantize=True)
+
+        assert quantized.embeddings.dtype == np.int8
+        assert quantized.scales.shape == (300,)
+        np.testing.assert_allclose(
+            quantized.similarities(query), exact.similarities(query), atol=0.01
+        )
+        assert quantized.top_k(query, k=1)[0][0].code == ":emoji_3:"
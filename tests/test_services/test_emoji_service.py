@@ -152,7 +152,7 @@ class TestEmojiServiceBasicOperations:
 
         assert result == sample_emojis
         mock_emoji_service.database_service.get_all_emojis.assert_called_once_with(
-            limit=10, offset=0
+            limit=10, offset=0, after_id=None
         )
 
     @pytest.mark.asyncio
@@ -310,6 +310,82 @@ class TestEmojiServiceBulkOperations:
         assert result[1].code == ":thumbsup:"
         assert result[2].code == ":heart:"
 
+    @pytest.mark.asyncio
+    async def test_load_emojis_from_json_file_saves_in_chunks(
+        self, mock_emoji_service, sample_emoji_json_data, tmp_path, monkeypatch
+    ):
+        """JSONファイルの絵文字がチャンクごとに保存されることを確認"""
+        import json
+
+        from app.services import emoji_service as emoji_service_module
+
+        json_file = tmp_path / "emojis.json"
+        json_file.write_text(json.dumps(sample_emoji_json_data), encoding="utf-8")
+        monkeypatch.setattr(emoji_service_module, "JSON_LOAD_CHUNK_SIZE", 2)
+        chunks = []
+
+        async def insert_chunks(emoji_chunks):
+            chunks.extend(emoji_chunks)
+            return sum(len(chunk) for chunk in chunks)
+
+        mock_emoji_service.database_service.batch_insert_emoji_chunks.side_effect = (
+            insert_chunks
+        )
+
+        count = await mock_emoji_service.load_emojis_from_json_file(str(json_file))
+
+        assert count == 3
+        # 全チャンクを1回の呼び出し（1トランザクション）で保存する
+        mock_emoji_service.database_service.batch_insert_emoji_chunks.assert_awaited_once()
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        assert [emoji.code for chunk in chunks for emoji in chunk] == [
+            ":smile:",
+            ":thumbsup:",
+            ":heart:",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_load_emojis_from_json_file_invalid_item_aborts_import(
+        self, mock_emoji_service, sample_emoji_json_data, tmp_path, monkeypatch
+    ):
+        """後続チャンクの不正なデータで取り込み全体が失敗することを確認"""
+        import json
+
+        from app.services import emoji_service as emoji_service_module
+
+        data = sample_emoji_json_data + [{"code": ":broken:"}]
+        json_file = tmp_path / "emojis.json"
+        json_file.write_text(json.dumps(data), encoding="utf-8")
+        monkeypatch.setattr(emoji_service_module, "JSON_LOAD_CHUNK_SIZE", 2)
+
+        # 解析・検証はトランザクションを開く前に行われ、何も保存されない
+        with pytest.raises(ValueError, match="description is required"):
+            await mock_emoji_service.load_emojis_from_json_file(str(json_file))
+        mock_emoji_service.database_service.batch_insert_emoji_chunks.assert_not_called()
+        mock_emoji_service.database_service.batch_insert_emojis.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_load_emojis_from_json_file_missing_file(
+        self, mock_emoji_service, tmp_path
+    ):
+        """存在しないファイルではトランザクションを開かずに失敗することを確認"""
+        with pytest.raises(FileNotFoundError):
+            await mock_emoji_service.load_emojis_from_json_file(
+                str(tmp_path / "missing.json")
+            )
+        mock_emoji_service.database_service.batch_insert_emoji_chunks.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_load_emojis_from_json_requires_array(
+        self, mock_emoji_service, tmp_path
+    ):
+        """ルートが配列でないJSONファイルはエラーになることを確認"""
+        json_file = tmp_path / "emojis.json"
+        json_file.write_text('{"code": ":smile:"}', encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            await mock_emoji_service.load_emojis_from_json(str(json_file))
+
     @pytest.mark.asyncio
     async def test_bulk_save_emojis(self, mock_emoji_service, sample_emoji_json_data):
         """絵文字一括保存テスト"""
@@ -454,6 +530,57 @@ class TestEmojiServiceCaching:
         result2 = await mock_emoji_service_with_cache.get_emoji_by_id(1)
         assert result2 == updated_emoji
 
+    @pytest.mark.asyncio
+    async def test_cache_invalidation_on_delete(self, mock_emoji_service_with_cache):
+        """ID指定の削除時のキャッシュ無効化テスト"""
+        sample_emoji = EmojiData(code=":smile:", description="Smiling face", id=1)
+        db_service = mock_emoji_service_with_cache.database_service
+        db_service.get_emoji_by_id.return_value = sample_emoji
+        db_service.delete_emoji.return_value = True
+
+        await mock_emoji_service_with_cache.get_emoji_by_id(1)
+        assert await mock_emoji_service_with_cache.delete_emoji(1) is True
+
+        # 削除後はキャッシュにも逆引きにも残らない
+        assert ":smile:" not in mock_emoji_service_with_cache.emoji_cache
+        db_service.get_emoji_by_id.return_value = None
+        assert await mock_emoji_service_with_cache.get_emoji_by_id(1) is None
+
+    @pytest.mark.asyncio
+    async def test_cache_size_tracks_cached_emojis(self, mock_emoji_service_with_cache):
+        """キャッシュの推定サイズが追加・削除に追従するテスト"""
+        service = mock_emoji_service_with_cache
+        emoji = EmojiData(
+            code=":smile:", description="Smiling face", id=1, embedding=[0.1] * 1536
+        )
+        service.database_service.get_emoji_by_id.return_value = emoji
+        service.database_service.update_emoji.return_value = emoji
+
+        await service.get_emoji_by_id(1)
+        size_mb = service.get_cache_stats()["cache_size_mb"]
+        # 埋め込み（float32 × 1536）分は少なくとも含まれる
+        assert size_mb * 1024 * 1024 >= 1536 * 4
+
+        await service.update_emoji(emoji)
+        assert service.get_cache_stats()["cache_size_mb"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cache_size_ignores_mutation_while_cached(
+        self, mock_emoji_service_with_cache
+    ):
+        """キャッシュ中に絵文字が変更されても推定サイズがずれないテスト"""
+        service = mock_emoji_service_with_cache
+        emoji = EmojiData(code=":smile:", description="Smiling face", id=1)
+        service.database_service.get_emoji_by_id.return_value = emoji
+        service.database_service.update_emoji.return_value = emoji
+
+        await service.get_emoji_by_id(1)
+        # キャッシュ中のインスタンスに埋め込みが後から設定される
+        emoji.embedding = [0.1] * 1536
+
+        await service.update_emoji(emoji)
+        assert service.get_cache_stats()["cache_size_mb"] == 0
+
 
 class TestEmojiServiceBusinessLogic:
     """EmojiServiceのビジネスロジックテスト"""
@@ -498,9 +625,54 @@ class TestEmojiServiceBusinessLogic:
     @pytest.mark.asyncio
     async def test_get_emojis_by_emotion_tone(self, mock_emoji_service):
         """感情トーン別絵文字取得テスト"""
+        mock_emoji_service.database_service.get_emojis_filtered.return_value = []
+
         result = await mock_emoji_service.get_emojis_by_emotion_tone("positive")
 
         assert isinstance(result, list)
+        # 絞り込みはDatabaseService側（SQL）で行う
+        mock_emoji_service.database_service.get_emojis_filtered.assert_called_once_with(
+            emotion_tone="positive"
+        )
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_emojis(self, mock_emoji_service):
+        """バルク更新がDatabaseServiceに委譲されることを確認"""
+        emojis = [
+            EmojiData(code=":smile:", description="Smile", id=1),
+            EmojiData(code=":cry:", description="Cry", id=2),
+        ]
+        mock_emoji_service.database_service.batch_update_emojis.return_value = emojis
+
+        result = await mock_emoji_service.bulk_update_emojis(emojis)
+
+        assert result == emojis
+        mock_emoji_service.database_service.batch_update_emojis.assert_called_once_with(
+            emojis
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_emojis_by_category_skips_embeddings(self, mock_emoji_service):
+        """カテゴリ別取得では埋め込みを読み込まず、後から一括取得できることを確認"""
+        emojis = [
+            EmojiData(code=":smile:", description="Smile", category="emotions", id=1),
+            EmojiData(code=":cat:", description="Cat", category="animals", id=2),
+        ]
+        mock_emoji_service.database_service.get_emojis_filtered.return_value = [
+            emojis[0]
+        ]
+
+        result = await mock_emoji_service.get_emojis_by_category("emotions")
+
+        assert result == [emojis[0]]
+        mock_emoji_service.database_service.get_emojis_filtered.assert_called_once_with(
+            category="emotions"
+        )
+
+        await mock_emoji_service.load_embeddings(result)
+        mock_emoji_service.database_service.load_embeddings.assert_called_once_with(
+            result
+        )
 
     @pytest.mark.asyncio
     async def test_validate_emoji_data(self, mock_emoji_service):
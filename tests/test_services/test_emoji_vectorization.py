@@ -1,5 +1,7 @@
 """Tests for emoji vectorization processing"""
 
+import asyncio
+
 import pytest
 import pytest_asyncio
 from unittest.mock import AsyncMock
@@ -28,7 +30,9 @@ class TestEmojiVectorization:
             return_value=np.array([0.1] * 1536, dtype=np.float32)
         )
         mock.get_embeddings_batch = AsyncMock(
-            return_value=[np.array([0.1] * 1536, dtype=np.float32) for _ in range(3)]
+            side_effect=lambda texts: [
+                np.array([0.1] * 1536, dtype=np.float32) for _ in texts
+            ]
         )
         mock.get_embedding_with_metadata = AsyncMock(
             return_value=(
@@ -139,14 +143,26 @@ class TestEmojiVectorization:
             ),
         ]
 
-        mock_database_service.get_all_emojis = AsyncMock(return_value=emojis)
+        # The database filters out emojis that already have embeddings
+        mock_database_service.get_emojis_for_vectorization = AsyncMock(
+            return_value=(
+                [emoji for emoji in emojis if emoji.embedding is None],
+                {"total": 3, "skipped": 1, "filtered_out": 0},
+            )
+        )
 
         # Call vectorize method with skip_existing=True (to be implemented)
         result = await emoji_service.vectorize_all_emojis(skip_existing=True)
 
+        mock_database_service.get_emojis_for_vectorization.assert_awaited_once_with(
+            skip_existing=True, category=None, emotion_tone=None
+        )
+        mock_database_service.get_all_emojis.assert_not_called()
+
         # Verify only emojis without embeddings were processed
         assert result["processed"] == 2
         assert result["skipped"] == 1
+        assert result["total"] == 3
 
     @pytest.mark.asyncio
     async def test_vectorize_with_progress_callback(
@@ -164,7 +180,9 @@ class TestEmojiVectorization:
             EmojiData(id=i, code=f":emoji{i}:", description=f"Emoji {i}")
             for i in range(5)
         ]
-        mock_database_service.get_all_emojis = AsyncMock(return_value=emojis)
+        mock_database_service.get_emojis_for_vectorization = AsyncMock(
+            return_value=(emojis, {"total": 5, "skipped": 0, "filtered_out": 0})
+        )
 
         # Call vectorize with progress callback (to be implemented)
         await emoji_service.vectorize_all_emojis(progress_callback=progress_callback)
@@ -174,6 +192,90 @@ class TestEmojiVectorization:
         assert progress_updates[-1]["current"] == 5
         assert progress_updates[-1]["total"] == 5
 
+    @pytest.mark.asyncio
+    async def test_vectorize_all_emojis_uses_batched_requests(
+        self,
+        emoji_service,
+        mock_openai_service_local,
+        mock_database_service,
+        monkeypatch,
+    ):
+        """Test that embeddings are requested in chunks instead of one by one"""
+        monkeypatch.setattr("app.services.emoji_service.EMBEDDING_BATCH_SIZE", 2)
+        emojis = [
+            EmojiData(id=i, code=f":emoji{i}:", description=f"Emoji {i}")
+            for i in range(5)
+        ]
+        mock_database_service.get_emojis_for_vectorization = AsyncMock(
+            return_value=(emojis, {"total": 5, "skipped": 0, "filtered_out": 0})
+        )
+
+        result = await emoji_service.vectorize_all_emojis()
+
+        assert result["processed"] == 5
+        assert mock_openai_service_local.get_embeddings_batch.await_count == 3
+        mock_openai_service_local.get_embedding.assert_not_called()
+        updates = mock_database_service.batch_update_embeddings.await_args.args[0]
+        assert sorted(updates) == list(range(5))
+        # Embeddings are passed through as arrays, without list conversion
+        assert all(isinstance(vector, np.ndarray) for vector in updates.values())
+
+    @pytest.mark.asyncio
+    async def test_vectorize_all_emojis_retries_failed_embeddings(
+        self, emoji_service, mock_openai_service_local, mock_database_service
+    ):
+        """Test that failed batch items are retried and never saved as placeholders"""
+        emojis = [
+            EmojiData(id=i, code=f":emoji{i}:", description=f"Emoji {i}")
+            for i in range(3)
+        ]
+        mock_database_service.get_emojis_for_vectorization = AsyncMock(
+            return_value=(emojis, {"total": 3, "skipped": 0, "filtered_out": 0})
+        )
+        # The batch call could not embed the last two texts
+        mock_openai_service_local.get_embeddings_batch.side_effect = None
+        mock_openai_service_local.get_embeddings_batch.return_value = [
+            np.full(1536, 0.1, dtype=np.float32),
+            None,
+            None,
+        ]
+        # The retry succeeds for one of them only
+        mock_openai_service_local.get_embedding.side_effect = [
+            np.full(1536, 0.2, dtype=np.float32),
+            Exception("API Error"),
+        ]
+
+        result = await emoji_service.vectorize_all_emojis()
+
+        assert result["processed"] == 2
+        assert [
+            call.args[0]
+            for call in mock_openai_service_local.get_embedding.call_args_list
+        ] == ["Emoji 1", "Emoji 2"]
+        updates = mock_database_service.batch_update_embeddings.await_args.args[0]
+        assert sorted(updates) == [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_vectorize_all_emojis_retries_failed_batch(
+        self, emoji_service, mock_openai_service_local, mock_database_service
+    ):
+        """Test that a failed batch request falls back to per-emoji requests"""
+        emojis = [
+            EmojiData(id=i, code=f":emoji{i}:", description=f"Emoji {i}")
+            for i in range(3)
+        ]
+        mock_database_service.get_emojis_for_vectorization = AsyncMock(
+            return_value=(emojis, {"total": 3, "skipped": 0, "filtered_out": 0})
+        )
+        mock_openai_service_local.get_embeddings_batch.side_effect = Exception(
+            "Batch embedding failed"
+        )
+
+        result = await emoji_service.vectorize_all_emojis()
+
+        assert result["processed"] == 3
+        assert mock_openai_service_local.get_embedding.await_count == 3
+
     @pytest.mark.asyncio
     async def test_vectorize_error_handling(
         self, emoji_service, mock_openai_service_local, mock_database_service
@@ -217,6 +319,87 @@ class TestEmojiVectorization:
         assert result["successful"] == 4
         assert result["failed"] == 2
 
+    @pytest.mark.asyncio
+    async def test_vectorize_batch_skips_failed_embeddings(
+        self, emoji_service, mock_openai_service_local, mock_database_service
+    ):
+        """Test that texts the API could not embed are counted as failed"""
+        mock_openai_service_local.get_embeddings_batch.side_effect = None
+        mock_openai_service_local.get_embeddings_batch.return_value = [
+            np.random.rand(1536),
+            None,
+        ]
+        emojis = [
+            EmojiData(id=i, code=f":emoji{i}:", description=f"Emoji {i}")
+            for i in range(2)
+        ]
+        mock_database_service.get_all_emojis = AsyncMock(return_value=emojis)
+
+        result = await emoji_service.vectorize_emojis_batch(batch_size=2)
+
+        assert result == {"successful": 1, "failed": 1}
+        updates = mock_database_service.batch_update_embeddings.await_args.args[0]
+        assert list(updates) == [0]
+
+    @pytest.mark.asyncio
+    async def test_vectorize_batch_overlaps_api_and_db(
+        self, emoji_service, mock_openai_service_local, mock_database_service
+    ):
+        """Test that the next embedding request starts before the DB write ends"""
+        events = []
+        write_started = asyncio.Event()
+
+        async def get_embeddings_batch(descriptions):
+            events.append("api")
+            if len(events) > 1:
+                await write_started.wait()
+            return [np.random.rand(1536) for _ in descriptions]
+
+        async def batch_update_embeddings(updates):
+            events.append("db_start")
+            write_started.set()
+            await asyncio.sleep(0.01)
+            events.append("db_end")
+            return True
+
+        mock_openai_service_local.get_embeddings_batch.side_effect = (
+            get_embeddings_batch
+        )
+        mock_database_service.batch_update_embeddings.side_effect = (
+            batch_update_embeddings
+        )
+        emojis = [
+            EmojiData(id=i, code=f":emoji{i}:", description=f"Emoji {i}")
+            for i in range(4)
+        ]
+        mock_database_service.get_all_emojis = AsyncMock(return_value=emojis)
+
+        result = await emoji_service.vectorize_emojis_batch(batch_size=2)
+
+        assert result == {"successful": 4, "failed": 0}
+        assert events.index("api", 1) < events.index("db_end")
+
+    @pytest.mark.asyncio
+    async def test_vectorize_batch_raises_without_continue_on_error(
+        self, emoji_service, mock_openai_service_local, mock_database_service
+    ):
+        """Test that a batch error is raised when continue_on_error is False"""
+        mock_openai_service_local.get_embeddings_batch.side_effect = [
+            [np.random.rand(1536) for _ in range(2)],
+            Exception("API Error"),
+        ]
+        emojis = [
+            EmojiData(id=i, code=f":emoji{i}:", description=f"Emoji {i}")
+            for i in range(4)
+        ]
+        mock_database_service.get_all_emojis = AsyncMock(return_value=emojis)
+
+        with pytest.raises(Exception, match="API Error"):
+            await emoji_service.vectorize_emojis_batch(batch_size=2)
+
+        # The batch fetched before the failure is still written
+        mock_database_service.batch_update_embeddings.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_update_emoji_embeddings_in_database(
         self, emoji_service, mock_database_service
@@ -276,7 +459,9 @@ class TestEmojiVectorization:
             EmojiData(id=i, code=f":emoji{i}:", description=f"Emoji {i}")
             for i in range(3)
         ]
-        mock_database_service.get_all_emojis = AsyncMock(return_value=emojis)
+        mock_database_service.get_emojis_for_vectorization = AsyncMock(
+            return_value=(emojis, {"total": 3, "skipped": 0, "filtered_out": 0})
+        )
 
         # Call vectorize in dry run mode (to be implemented)
         result = await emoji_service.vectorize_all_emojis(dry_run=True)
@@ -314,13 +499,20 @@ class TestEmojiVectorization:
                 emotion_tone="neutral",
             ),
         ]
-        mock_database_service.get_all_emojis = AsyncMock(return_value=emojis)
+        # The database applies the category/emotion filters
+        mock_database_service.get_emojis_for_vectorization = AsyncMock(
+            return_value=(emojis[:1], {"total": 3, "skipped": 0, "filtered_out": 2})
+        )
 
         # Call vectorize with filters (to be implemented)
         result = await emoji_service.vectorize_all_emojis(
             category="emotions", emotion_tone="positive"
         )
 
+        mock_database_service.get_emojis_for_vectorization.assert_awaited_once_with(
+            skip_existing=False, category="emotions", emotion_tone="positive"
+        )
+
         # Verify only filtered emojis were processed
         assert result["processed"] == 1
         assert result["filtered_out"] == 2
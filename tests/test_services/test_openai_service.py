@@ -104,6 +104,20 @@ class TestOpenAIService:
             assert result.shape == (1536,)
             assert result.dtype == np.float32
 
+    @pytest.mark.asyncio
+    async def test_get_embeddings_batch_marks_failures_as_none(self, openai_service):
+        """Test that failed texts yield None instead of a placeholder vector"""
+        embedding = np.full(1536, 0.1, dtype=np.float32)
+        openai_service.get_embedding = AsyncMock(
+            side_effect=[embedding, Exception("API Error"), embedding]
+        )
+
+        results = await openai_service.get_embeddings_batch(["text1", "text2", "text3"])
+
+        assert results[0] is embedding
+        assert results[1] is None
+        assert results[2] is embedding
+
     @pytest.mark.asyncio
     async def test_get_embeddings_batch_empty_list(self, openai_service):
         """Test batch embedding with empty list"""
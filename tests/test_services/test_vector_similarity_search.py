@@ -4,11 +4,11 @@ TDD Phase 3 - Task 3.3
 """
 
 import pytest
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 import numpy as np
-import json
 
-from app.services.database_service import DatabaseService
+from app.services.database_service import DatabaseService, _EMOJI_COLUMNS
 from app.services.emoji_service import EmojiService
 from app.models.emoji import EmojiData
 
@@ -23,16 +23,40 @@ class TestVectorSimilaritySearch:
 
         # Create mock cursor
         mock_cursor = MagicMock()
-        mock_cursor.fetchall = AsyncMock(return_value=mock_results)
+        mock_cursor.row_factory = None
+        mock_cursor.description = [
+            SimpleNamespace(name=name)
+            for name in _EMOJI_COLUMNS + ("similarity_score",)
+        ]
         mock_cursor.execute = AsyncMock()
 
+        # Apply the row factory requested by the service, as psycopg would
+        async def fetchall():
+            if mock_cursor.row_factory is None:
+                return mock_results
+            make_row = mock_cursor.row_factory(mock_cursor)
+            return [make_row(row) for row in mock_results]
+
+        mock_cursor.fetchall = AsyncMock(side_effect=fetchall)
+
         # Make cursor an async context manager
         mock_cursor.__aenter__ = AsyncMock(return_value=mock_cursor)
         mock_cursor.__aexit__ = AsyncMock(return_value=None)
 
         # Create mock connection
         mock_conn = MagicMock()
-        mock_conn.cursor.return_value = mock_cursor
+
+        def cursor(row_factory=None):
+            mock_cursor.row_factory = row_factory
+            return mock_cursor
+
+        mock_conn.cursor.side_effect = cursor
+
+        # Make connection.transaction() an async context manager
+        mock_transaction = MagicMock()
+        mock_transaction.__aenter__ = AsyncMock(return_value=None)
+        mock_transaction.__aexit__ = AsyncMock(return_value=None)
+        mock_conn.transaction.return_value = mock_transaction
 
         # Make connection an async context manager
         mock_conn.__aenter__ = AsyncMock(return_value=mock_conn)
@@ -130,7 +154,7 @@ class TestVectorSimilaritySearch:
                 "positive",
                 "greeting",
                 1,
-                json.dumps([0.1] * 1536),
+                np.full(1536, 0.1, dtype=np.float32),
                 "2024-01-01",
                 "2024-01-01",
                 0.99,
@@ -143,7 +167,7 @@ class TestVectorSimilaritySearch:
                 "positive",
                 "funny",
                 2,
-                json.dumps([0.11] * 1536),
+                np.full(1536, 0.11, dtype=np.float32),
                 "2024-01-01",
                 "2024-01-01",
                 0.95,
@@ -156,7 +180,7 @@ class TestVectorSimilaritySearch:
                 "positive",
                 "love",
                 3,
-                json.dumps([0.15] * 1536),
+                np.full(1536, 0.15, dtype=np.float32),
                 "2024-01-01",
                 "2024-01-01",
                 0.85,
@@ -196,7 +220,7 @@ class TestVectorSimilaritySearch:
                 "positive",
                 "greeting",
                 1,
-                json.dumps([0.1] * 1536),
+                np.full(1536, 0.1, dtype=np.float32),
                 "2024-01-01",
                 "2024-01-01",
                 0.99,
@@ -209,7 +233,7 @@ class TestVectorSimilaritySearch:
                 "positive",
                 "funny",
                 2,
-                json.dumps([0.11] * 1536),
+                np.full(1536, 0.11, dtype=np.float32),
                 "2024-01-01",
                 "2024-01-01",
                 0.95,
@@ -247,6 +271,151 @@ class TestVectorSimilaritySearch:
         # Verify empty results
         assert results == []
 
+    @pytest.mark.asyncio
+    async def test_find_similar_emojis_uses_normalized_inner_product(
+        self, query_vector
+    ):
+        """Test search orders by inner product with a normalized halfvec query"""
+        db_service = DatabaseService()
+        _, _, mock_cursor = self.setup_mock_db_connection(db_service, [])
+
+        await db_service.find_similar_emojis(query_vector, limit=3)
+
+        query, params = mock_cursor.execute.call_args[0]
+        assert "embedding <#> %s" in query
+        assert abs(np.linalg.norm(params[0].to_numpy()) - 1.0) < 1e-3
+        assert params[-1] == 3
+
+    @pytest.mark.asyncio
+    async def test_find_similar_emojis_reuses_prepared_query(self, query_vector):
+        """Test filter sets share one prepared statement regardless of key order"""
+        db_service = DatabaseService()
+        _, _, mock_cursor = self.setup_mock_db_connection(db_service, [])
+
+        await db_service.find_similar_emojis(
+            query_vector, filters={"category": "emotions", "emotion_tone": "positive"}
+        )
+        first_query, first_params = mock_cursor.execute.call_args[0]
+        db_service.similarity_cache.clear()
+        await db_service.find_similar_emojis(
+            query_vector,
+            filters={"emotion_tone": "positive", "category": "emotions", "x": 1},
+        )
+        second_query, second_params = mock_cursor.execute.call_args[0]
+
+        assert first_query is second_query
+        assert first_params[1:] == second_params[1:] == ["positive", "emotions", 3]
+        assert mock_cursor.execute.call_args[1]["prepare"] is True
+
+    @pytest.mark.asyncio
+    async def test_find_similar_emojis_skips_embedding_by_default(self, query_vector):
+        """Test embeddings are only transferred when explicitly requested"""
+        db_service = DatabaseService()
+        mock_results = [
+            (1, ":smile:", "A happy smiling face", "emotions", "positive")
+            + ("greeting", 1, None, "2024-01-01", "2024-01-01", 0.99)
+        ]
+        _, _, mock_cursor = self.setup_mock_db_connection(db_service, mock_results)
+
+        results = await db_service.find_similar_emojis(query_vector)
+        query = mock_cursor.execute.call_args[0][0]
+        assert "NULL::halfvec AS embedding" in query
+        assert results[0].embedding is None
+        assert results[0].similarity_score == 0.99
+
+        await db_service.find_similar_emojis(query_vector, return_embedding=True)
+        query = mock_cursor.execute.call_args[0][0]
+        assert "NULL::halfvec" not in query
+
+    @pytest.mark.asyncio
+    async def test_find_similar_emojis_uses_similarity_cache(self, query_vector):
+        """Test near-identical queries are served from the similarity cache"""
+        db_service = DatabaseService()
+        mock_results = [
+            (1, ":smile:", "A happy smiling face", "emotions", "positive")
+            + ("greeting", 1, None, "2024-01-01", "2024-01-01", 0.99)
+        ]
+        _, _, mock_cursor = self.setup_mock_db_connection(db_service, mock_results)
+
+        first = await db_service.find_similar_emojis(query_vector)
+        nearby = np.array(query_vector) * 2 + 1e-4  # same direction, new scale
+        second = await db_service.find_similar_emojis(nearby)
+        assert mock_cursor.execute.await_count == 1
+        assert [e.code for e in second] == [e.code for e in first]
+
+        # Different search conditions must not reuse the cached result
+        await db_service.find_similar_emojis(query_vector, limit=5)
+        assert mock_cursor.execute.await_count == 2
+
+        # Writes invalidate the cache
+        mock_cursor.rowcount = 1
+        await db_service.delete_emoji(1)
+        await db_service.find_similar_emojis(query_vector)
+        assert mock_cursor.execute.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_find_similar_emojis_recall_tier(self, query_vector):
+        """Test recall tiers set hnsw.ef_search locally before searching"""
+        from app.services.database_service import DatabaseOperationError
+
+        db_service = DatabaseService()
+        _, mock_conn, mock_cursor = self.setup_mock_db_connection(db_service, [])
+
+        await db_service.find_similar_emojis(query_vector)
+        assert mock_cursor.execute.await_count == 1  # balanced: no SET
+        mock_conn.transaction.assert_called()
+
+        await db_service.find_similar_emojis(query_vector, recall_tier="high")
+        statements = [call.args[0] for call in mock_cursor.execute.await_args_list]
+        assert statements[1] == "SET LOCAL hnsw.ef_search = 100"
+
+        await db_service.find_similar_emojis(query_vector, limit=30, recall_tier="fast")
+        statements = [call.args[0] for call in mock_cursor.execute.await_args_list]
+        assert statements[3] == "SET LOCAL hnsw.ef_search = 30"
+
+        with pytest.raises(DatabaseOperationError, match="Invalid recall tier"):
+            await db_service.find_similar_emojis(query_vector, recall_tier="max")
+
+    def test_emoji_row_factory_maps_columns_by_name(self):
+        """Test the row factory does not depend on the SELECT column order"""
+        from app.services.database_service import _emoji_row
+
+        names = ("similarity_score", "code", "id") + _EMOJI_COLUMNS[2:]
+        cursor = SimpleNamespace(
+            description=[SimpleNamespace(name=name) for name in names]
+        )
+        row = (0.5, ":smile:", 7, "A happy smiling face", "emotions", "positive")
+        row += ("greeting", 2, None, "2024-01-01", "2024-01-02")
+
+        emoji = _emoji_row(cursor)(row)
+
+        assert isinstance(emoji, EmojiData)
+        assert emoji.id == 7
+        assert emoji.code == ":smile:"
+        assert emoji.priority == 2
+        assert emoji.embedding is None
+        assert emoji.updated_at == "2024-01-02"
+        assert emoji.similarity_score == 0.5
+
+    def test_halfvec_loaders_return_float32_arrays(self):
+        """Test halfvec columns are loaded as float32 ndarrays"""
+        from pgvector import HalfVector
+        from app.services.database_service import (
+            _HalfVectorBinaryLoader,
+            _HalfVectorTextLoader,
+        )
+
+        vector = np.linspace(-1, 1, 1536, dtype=np.float32)
+        half = HalfVector(vector)
+
+        for loaded in (
+            _HalfVectorBinaryLoader(0).load(half.to_binary()),
+            _HalfVectorTextLoader(0).load(half.to_text().encode()),
+        ):
+            assert loaded.dtype == np.float32
+            assert loaded.shape == (1536,)
+            np.testing.assert_allclose(loaded, vector, atol=1e-3)
+
     @pytest.mark.asyncio
     async def test_find_similar_emojis_invalid_dimension(self):
         """Test vector similarity search with invalid vector dimension"""
@@ -276,7 +445,7 @@ class TestVectorSimilaritySearch:
                 "positive",
                 "scene",
                 1,
-                json.dumps([0.1] * 1536),
+                np.full(1536, 0.1, dtype=np.float32),
                 "2024-01-01",
                 "2024-01-01",
                 0.99,
@@ -289,7 +458,7 @@ class TestVectorSimilaritySearch:
                 "positive",
                 "scene",
                 1,
-                json.dumps([0.1] * 1536),
+                np.full(1536, 0.1, dtype=np.float32),
                 "2024-01-01",
                 "2024-01-01",
                 0.95,
@@ -302,7 +471,7 @@ class TestVectorSimilaritySearch:
                 "positive",
                 "scene",
                 1,
-                json.dumps([0.1] * 1536),
+                np.full(1536, 0.1, dtype=np.float32),
                 "2024-01-01",
                 "2024-01-01",
                 0.90,
@@ -315,7 +484,7 @@ class TestVectorSimilaritySearch:
                 "positive",
                 "scene",
                 1,
-                json.dumps([0.1] * 1536),
+                np.full(1536, 0.1, dtype=np.float32),
                 "2024-01-01",
                 "2024-01-01",
                 0.85,
@@ -499,7 +668,7 @@ class TestVectorSimilaritySearch:
                 "positive",
                 "scene",
                 1,
-                json.dumps([0.1] * 1536),
+                np.full(1536, 0.1, dtype=np.float32),
                 "2024-01-01",
                 "2024-01-01",
                 0.95,
@@ -512,7 +681,7 @@ class TestVectorSimilaritySearch:
                 "positive",
                 "scene",
                 1,
-                json.dumps([0.1] * 1536),
+                np.full(1536, 0.1, dtype=np.float32),
                 "2024-01-01",
                 "2024-01-01",
                 0.85,
@@ -525,7 +694,7 @@ class TestVectorSimilaritySearch:
                 "positive",
                 "scene",
                 1,
-                json.dumps([0.1] * 1536),
+                np.full(1536, 0.1, dtype=np.float32),
                 "2024-01-01",
                 "2024-01-01",
                 0.75,
@@ -538,7 +707,7 @@ class TestVectorSimilaritySearch:
                 "positive",
                 "scene",
                 1,
-                json.dumps([0.1] * 1536),
+                np.full(1536, 0.1, dtype=np.float32),
                 "2024-01-01",
                 "2024-01-01",
                 0.65,
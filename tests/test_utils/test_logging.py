@@ -6,6 +6,7 @@ import pytest
 from io import StringIO
 from unittest.mock import patch, MagicMock
 
+from app.config import Config
 from app.utils.logging import (
     StructuredFormatter,
     HumanReadableFormatter,
@@ -186,11 +187,13 @@ class TestSetupLogging:
 
     def test_setup_with_defaults(self):
         """Test setup with default parameters."""
-        logger = setup_logging()
+        # Default level comes from Config
+        with patch.object(Config, "LOG_LEVEL", "WARNING"):
+            logger = setup_logging()
 
         assert logger.name == "slack_emoji_bot"
         # Check effective level (logger inherits from root)
-        assert logger.getEffectiveLevel() == logging.INFO  # Default from Config
+        assert logger.getEffectiveLevel() == logging.WARNING
 
     def test_setup_with_structured_logging(self):
         """Test setup with structured logging."""
@@ -0,0 +1,97 @@
+"""
+SimilarityCacheのテスト
+"""
+
+import numpy as np
+
+from app.utils.similarity_cache import SimilarityCache
+
+
+def _unit(vector):
+    vector = np.asarray(vector, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+class TestSimilarityCache:
+    """SimilarityCacheのテストクラス"""
+
+    def test_hit_for_near_vector(self):
+        """閾値以上に近いベクトルでヒットすること"""
+        cache = SimilarityCache(max_size=4, threshold=0.97, dimension=3)
+        cache.put(_unit([1, 0, 0]), "ctx", ["result"])
+
+        assert cache.get(_unit([1, 0.1, 0]), "ctx") == ["result"]
+        assert cache.get(_unit([1, 1, 0]), "ctx") is None
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+
+    def test_context_must_match(self):
+        """検索条件が異なる場合はヒットしないこと"""
+        cache = SimilarityCache(max_size=4, dimension=3)
+        cache.put(_unit([1, 0, 0]), ("positive", 3), "a")
+
+        assert cache.get(_unit([1, 0, 0]), ("negative", 3)) is None
+        assert cache.get(_unit([1, 0, 0]), ("positive", 3)) == "a"
+
+    def test_evicts_least_recently_used(self):
+        """満杯の場合は最も長く使われていないエントリが置き換えられること"""
+        cache = SimilarityCache(max_size=2, dimension=3)
+        cache.put(_unit([1, 0, 0]), "ctx", "x")
+        cache.put(_unit([0, 1, 0]), "ctx", "y")
+        cache.get(_unit([1, 0, 0]), "ctx")  # xを最近使用にする
+
+        cache.put(_unit([0, 0, 1]), "ctx", "z")
+
+        assert len(cache) == 2
+        assert cache.get(_unit([1, 0, 0]), "ctx") == "x"
+        assert cache.get(_unit([0, 1, 0]), "ctx") is None
+        assert cache.get(_unit([0, 0, 1]), "ctx") == "z"
+
+    def test_clear(self):
+        """clearで全エントリが破棄されること"""
+        cache = SimilarityCache(max_size=2, dimension=3)
+        cache.put(_unit([1, 0, 0]), "ctx", "x")
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.get(_unit([1, 0, 0]), "ctx") is None
+
+    def test_put_ignored_after_clear(self):
+        """clear前の世代を指定したputは保存されないこと"""
+        cache = SimilarityCache(max_size=2, dimension=3)
+        generation = cache.generation
+
+        cache.clear()
+        cache.put(_unit([1, 0, 0]), "ctx", "stale", generation=generation)
+        assert cache.get(_unit([1, 0, 0]), "ctx") is None
+
+        cache.put(_unit([1, 0, 0]), "ctx", "fresh", generation=cache.generation)
+        assert cache.get(_unit([1, 0, 0]), "ctx") == "fresh"
+
+    def test_results_are_copied(self):
+        """呼び出し側で結果を変更してもキャッシュに影響しないこと"""
+        cache = SimilarityCache(max_size=2, dimension=3)
+        result = [{"code": ":smile:"}]
+        cache.put(_unit([1, 0, 0]), "ctx", result)
+        result[0]["code"] = ":changed:"
+
+        cached = cache.get(_unit([1, 0, 0]), "ctx")
+        assert cached == [{"code": ":smile:"}]
+        cached[0]["code"] = ":changed:"
+        assert cache.get(_unit([1, 0, 0]), "ctx") == [{"code": ":smile:"}]
+
+    def test_memory_is_bounded(self):
+        """キー行列は使用時に確保され、contextは上限付きで保持されること"""
+        cache = SimilarityCache(max_size=2, dimension=3)
+        assert cache._vectors is None
+        assert cache.get(_unit([1, 0, 0]), "ctx") is None
+
+        for i in range(10):
+            cache.put(_unit([1, 0, 0]), ("ctx", i), i)
+
+        assert cache._vectors.shape == (2, 3)
+        assert len(cache._context_ids) <= cache.max_size + 1
+        assert cache.get(_unit([1, 0, 0]), ("ctx", 9)) == 9
+        assert cache.get(_unit([1, 0, 0]), ("ctx", 8)) == 8
+        assert cache.get(_unit([1, 0, 0]), ("ctx", 0)) is None